@@ -2,190 +2,126 @@
 Chain physics implementation using Verlet integration.
 """
 
-import math
 import pygame
 from .config import (
     CHAIN_SEGMENTS, SEGMENT_LENGTH, CHAIN_COLOR, CHAIN_THICKNESS,
-    DAMPING, GRAVITY, CONSTRAINT_ITERATIONS, CHAIN_SEGMENT_RADIUS,
+    DAMPING, GRAVITY, CONSTRAINT_ITERATIONS, PHYSICS_SUBSTEPS, CHAIN_SEGMENT_RADIUS, MAX_DT,
     SCREEN_WIDTH, SCREEN_HEIGHT, CENTER_LINE_X
 )
 from typing import Optional
+from .chain_kernel import get_step, coordinate_array, pixel_points
+from .game_objects import circle_sprite
+
+
+def _coordinate(name):
+    """Property reading and writing one entry of the owning chain's `name` array"""
+    def fget(self):
+        return float(getattr(self._chain, name)[self._index])
+    
+    def fset(self, value):
+        getattr(self._chain, name)[self._index] = value
+    
+    return property(fget, fset)
 
 
 class ChainSegment:
-    """A single point in the chain using Verlet integration"""
+    """View of a single point in the chain; the coordinates live in the Chain's arrays"""
     
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.old_x = x
-        self.old_y = y
-        self.pinned = False
+    __slots__ = ('_chain', '_index')
     
-    def update(self, dt, damping: Optional[float] = None, gravity: Optional[float] = None):
-        """Update position using Verlet integration"""
-        if self.pinned:
-            self.old_x = self.x
-            self.old_y = self.y
-            return
-        
-        damping_val = damping if damping is not None else DAMPING
-        gravity_val = gravity if gravity is not None else GRAVITY
-        
-        # Calculate velocity from position history
-        vel_x = (self.x - self.old_x) * damping_val
-        vel_y = (self.y - self.old_y) * damping_val
-        
-        # Store current position
-        temp_x = self.x
-        temp_y = self.y
-        
-        # Update position with velocity and gravity
-        self.x += vel_x
-        self.y += vel_y + gravity_val * dt * dt
-        
-        # Store old position
-        self.old_x = temp_x
-        self.old_y = temp_y
+    def __init__(self, chain, index):
+        self._chain = chain
+        self._index = index
     
-    def constrain_to_bounds(self, min_x=None, max_x=None):
-        """Keep segment within screen boundaries and optionally restrict to half"""
-        if min_x is not None and self.x < min_x:
-            self.x = min_x
-        elif self.x < 0:
-            self.x = 0
-            
-        if max_x is not None and self.x > max_x:
-            self.x = max_x
-        elif self.x > SCREEN_WIDTH:
-            self.x = SCREEN_WIDTH
-        
-        if self.y < 0:
-            self.y = 0
-        elif self.y > SCREEN_HEIGHT:
-            self.y = SCREEN_HEIGHT
+    x = _coordinate('xs')
+    y = _coordinate('ys')
+    old_x = _coordinate('old_xs')
+    old_y = _coordinate('old_ys')
+    
+    @property
+    def pinned(self):
+        """The first point is pinned to the striker"""
+        return self._index == 0
 
 
 class Chain:
     """Physics-based chain connecting striker to hammer"""
     
-    def __init__(self, start_x, start_y, color=CHAIN_COLOR, 
+    def __init__(self, start_x, start_y, color=CHAIN_COLOR,
                  segments: Optional[int] = None, segment_length: Optional[float] = None,
                  thickness: Optional[int] = None):
-        self.segments = []
         self.color = color
         self.segment_length = segment_length if segment_length is not None else SEGMENT_LENGTH
         self.thickness = thickness if thickness is not None else CHAIN_THICKNESS
         
         num_segments = segments if segments is not None else CHAIN_SEGMENTS
         
-        # Create chain segments
-        for i in range(num_segments + 1):
-            x = start_x + i * self.segment_length
-            y = start_y
-            segment = ChainSegment(x, y)
-            self.segments.append(segment)
+        # Point coordinates as parallel arrays (structure of arrays) for step_chain
+        xs = [start_x + i * self.segment_length for i in range(num_segments + 1)]
+        ys = [start_y] * (num_segments + 1)
+        self.xs = coordinate_array(xs)
+        self.ys = coordinate_array(ys)
+        self.old_xs = coordinate_array(xs)
+        self.old_ys = coordinate_array(ys)
+        self._step = get_step(num_segments + 1)
+        # Small circle stamped at each segment for visual effect
+        self._dot, self._dot_offset = circle_sprite([(self.color, 3, 0)])
+    
+    @property
+    def segments(self):
+        """Per-point views, for callers that want segment objects"""
+        return [ChainSegment(self, i) for i in range(len(self.xs))]
     
     def update(self, dt, striker_x, striker_y, striker_radius, min_x=None, max_x=None,
                damping: Optional[float] = None, gravity: Optional[float] = None,
-               constraint_iterations: Optional[int] = None):
-        """Update all segments with optional horizontal boundaries"""
-        # Pin first segment to striker
-        self.segments[0].x = striker_x
-        self.segments[0].y = striker_y
-        self.segments[0].pinned = True
-        
+               constraint_iterations: Optional[int] = None, substeps: Optional[int] = None):
+        """
+        Update all segments with optional horizontal boundaries.
+        The frame is split into substeps (the striker moving linearly across them);
+        constraint_iterations is the per-frame budget, shared out between the substeps
+        (rounded down, at least one each)
+        """
         iterations = constraint_iterations if constraint_iterations is not None else CONSTRAINT_ITERATIONS
+        substeps = substeps if substeps is not None else PHYSICS_SUBSTEPS
+        damping_val = damping if damping is not None else DAMPING
+        gravity_val = gravity if gravity is not None else GRAVITY
         
-        # Update all other segments
-        for segment in self.segments[1:]:
-            segment.update(dt, damping, gravity)
-            segment.constrain_to_bounds(min_x, max_x)
+        # A stalled frame must not turn into one huge Verlet step
+        dt = min(dt, MAX_DT)
         
-        # Apply distance constraints multiple times for stability
-        for _ in range(iterations):
-            self.apply_constraints()
-            # Apply striker collision after each constraint iteration for better stability
-            self.apply_striker_collision(striker_x, striker_y, striker_radius)
-            # Re-constrain segments after constraints to respect boundaries
-            for segment in self.segments[1:]:
-                segment.constrain_to_bounds(min_x, max_x)
-    
-    def apply_constraints(self):
-        """Maintain fixed distance between segments"""
-        for i in range(len(self.segments) - 1):
-            seg1 = self.segments[i]
-            seg2 = self.segments[i + 1]
-            
-            # Calculate distance between segments
-            dx = seg2.x - seg1.x
-            dy = seg2.y - seg1.y
-            distance = math.sqrt(dx * dx + dy * dy)
-            
-            # Avoid division by zero
-            if distance < 0.01:
-                distance = 0.01
-            
-            # Calculate difference from desired length
-            difference = (self.segment_length - distance) / distance
-            
-            # Move segments to maintain distance
-            offset_x = dx * difference * 0.5
-            offset_y = dy * difference * 0.5
-            
-            if not seg1.pinned:
-                seg1.x -= offset_x
-                seg1.y -= offset_y
-            
-            if not seg2.pinned:
-                seg2.x += offset_x
-                seg2.y += offset_y
-    
-    def apply_striker_collision(self, striker_x, striker_y, striker_radius):
-        """Prevent chain segments from passing through the striker"""
-        # Check collision for all segments except the first one (which is pinned to striker)
-        for i in range(1, len(self.segments)):
-            seg = self.segments[i]
-            
-            # Calculate distance from segment to striker center
-            dx = seg.x - striker_x
-            dy = seg.y - striker_y
-            distance = math.sqrt(dx * dx + dy * dy)
-            
-            # Check if segment is colliding with striker
-            collision_distance = striker_radius + CHAIN_SEGMENT_RADIUS
-            
-            if distance < collision_distance and distance > 0.01:
-                # Push segment away from striker
-                # Normalize direction
-                nx = dx / distance
-                ny = dy / distance
-                
-                # Calculate how much to push
-                overlap = collision_distance - distance
-                
-                # Move segment away from striker
-                seg.x += nx * overlap
-                seg.y += ny * overlap
+        # Per-substep equivalents: damping compounds to the per-frame value, gravity
+        # displacement scales with the substep length squared
+        sub_iterations = int(max(1, iterations // substeps))
+        sub_damping = float(damping_val ** (1.0 / substeps))
+        sub_dt = dt / substeps
+        drop = float(gravity_val * sub_dt * sub_dt)
+        collision_distance = float(striker_radius + CHAIN_SEGMENT_RADIUS)
+        segment_length = float(self.segment_length)
+        min_x = float(min_x if min_x is not None else 0)
+        max_x = float(max_x if max_x is not None else SCREEN_WIDTH)
+        max_y = float(SCREEN_HEIGHT)
+        
+        # Verlet step, distance constraints, striker collision and bounds in one pass per substep
+        from_x = float(self.xs[0])
+        from_y = float(self.ys[0])
+        to_x = float(striker_x)
+        to_y = float(striker_y)
+        for k in range(1, substeps + 1):
+            t = k / substeps
+            self._step(self.xs, self.ys, self.old_xs, self.old_ys,
+                       from_x + (to_x - from_x) * t, from_y + (to_y - from_y) * t, collision_distance,
+                       sub_damping, drop, segment_length, sub_iterations,
+                       min_x, max_x, max_y)
     
     def get_hammer_position(self):
         """Get position of the last segment (where hammer attaches)"""
-        last_seg = self.segments[-1]
-        return last_seg.x, last_seg.y
+        return float(self.xs[-1]), float(self.ys[-1])
     
     def draw(self, screen):
         """Draw the chain"""
-        # Draw chain segments as connected lines
-        for i in range(len(self.segments) - 1):
-            seg1 = self.segments[i]
-            seg2 = self.segments[i + 1]
-            pygame.draw.line(screen, self.color, 
-                           (int(seg1.x), int(seg1.y)), 
-                           (int(seg2.x), int(seg2.y)), 
-                           self.thickness)
+        points = pixel_points(self.xs, self.ys)
         
-        # Draw small circles at each segment for visual effect
-        for segment in self.segments:
-            pygame.draw.circle(screen, self.color, 
-                             (int(segment.x), int(segment.y)), 3)
-
+        # Connected lines in one call, then one batched blit for the segment dots
+        pygame.draw.lines(screen, self.color, False, points, self.thickness)
+        dot, offset = self._dot, self._dot_offset
+        screen.blits([(dot, (x - offset, y - offset)) for x, y in points], doreturn=False)
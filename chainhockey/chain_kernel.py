@@ -0,0 +1,215 @@
+"""
+Per-frame chain step (Verlet integration, distance constraints, striker
+collision and bounds) fused into one compiled function.
+"""
+
+from array import array
+from math import sqrt
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    np = None
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python"""
+        return lambda func: func
+
+# Cython build of step_chain (chain_step.pyx), used where numba isn't available
+try:
+    from .chain_step import step_chain as cython_step_chain
+    CYTHON_STEP_AVAILABLE = True
+except ImportError:
+    CYTHON_STEP_AVAILABLE = False
+    cython_step_chain = None
+
+
+# A pair is at rest once its squared length is within (REST_TOLERANCE * length) ** 2 of length ** 2
+REST_TOLERANCE = 0.02
+
+
+def coordinate_array(values):
+    """
+    Storage for one chain coordinate: a float64 array for the numba step, a double
+    array.array for the Cython one, else a list. Always a new copy of values
+    """
+    if NUMBA_AVAILABLE:
+        return np.array(values, dtype=np.float64)
+    if CYTHON_STEP_AVAILABLE:
+        return array('d', values)
+    return [float(v) for v in values]
+
+
+def pixel_points(xs, ys):
+    """(int(x), int(y)) for each point, truncating a whole array at once when it is one"""
+    if NUMBA_AVAILABLE:
+        return list(zip(xs.astype(np.int64).tolist(), ys.astype(np.int64).tolist()))
+    return [(int(x), int(y)) for x, y in zip(xs, ys)]
+
+
+@njit(cache=True)
+def step_chain(xs, ys, old_xs, old_ys, striker_x, striker_y, collision_distance,
+               damping, drop, segment_length, iterations, min_x, max_x, max_y):
+    """
+    Advance a chain pinned at (striker_x, striker_y) by one frame, in place.
+    collision_distance is the striker radius plus the segment radius;
+    drop is the gravity displacement (gravity * dt * dt).
+    """
+    n = len(xs)
+    reach_sq = collision_distance * collision_distance
+    length_sq = segment_length * segment_length
+    rest_tolerance_sq = REST_TOLERANCE * REST_TOLERANCE * length_sq
+    
+    # Pin first segment to striker; it keeps no velocity of its own
+    xs[0] = striker_x
+    ys[0] = striker_y
+    old_xs[0] = striker_x
+    old_ys[0] = striker_y
+    
+    # Verlet step for all other segments (velocity from position history, plus gravity)
+    for i in range(1, n):
+        x = xs[i]
+        y = ys[i]
+        x += (x - old_xs[i]) * damping
+        y += (y - old_ys[i]) * damping + drop
+        old_xs[i] = xs[i]
+        old_ys[i] = ys[i]
+        if x < min_x:
+            x = min_x
+        elif x > max_x:
+            x = max_x
+        if y < 0.0:
+            y = 0.0
+        elif y > max_y:
+            y = max_y
+        xs[i] = x
+        ys[i] = y
+    
+    for _ in range(iterations):
+        # Distance constraints, first segment to last
+        for i in range(n - 1):
+            dx = xs[i + 1] - xs[i]
+            dy = ys[i + 1] - ys[i]
+            dist_sq = dx * dx + dy * dy
+            
+            # Pairs already at rest length need no correction
+            if abs(dist_sq - length_sq) < rest_tolerance_sq:
+                continue
+            
+            # One root per pair; near-coincident points use the 0.01 floor distance
+            inv_distance = 1.0 / sqrt(dist_sq) if dist_sq > 0.0001 else 100.0
+            
+            # Move each end half the relative length error, in opposite directions
+            difference = (segment_length * inv_distance - 1.0) * 0.5
+            offset_x = dx * difference
+            offset_y = dy * difference
+            if i > 0:
+                xs[i] -= offset_x
+                ys[i] -= offset_y
+            xs[i + 1] += offset_x
+            ys[i + 1] += offset_y
+        
+        # Push segments out of the striker, then back inside the bounds
+        for i in range(1, n):
+            x = xs[i]
+            y = ys[i]
+            dx = x - striker_x
+            dy = y - striker_y
+            dist_sq = dx * dx + dy * dy
+            if 0.0001 < dist_sq < reach_sq:
+                push = collision_distance / sqrt(dist_sq) - 1.0
+                x += dx * push
+                y += dy * push
+            if x < min_x:
+                x = min_x
+            elif x > max_x:
+                x = max_x
+            if y < 0.0:
+                y = 0.0
+            elif y > max_y:
+                y = max_y
+            xs[i] = x
+            ys[i] = y
+
+
+# Plain-Python step_chain variants unrolled for a fixed point count, keyed by that count
+_unrolled_steps = {}
+
+
+def _unrolled_source(n):
+    """
+    Source of step_chain for exactly n points with the per-point loops unrolled.
+    Coordinates live in locals (x1, y1, ...) for the whole step and are written
+    back once at the end, so the constraint iterations never index the lists.
+    """
+    def clamp(i, indent):
+        pad = ' ' * indent
+        return [f"{pad}if x{i} < min_x: x{i} = min_x",
+                f"{pad}elif x{i} > max_x: x{i} = max_x",
+                f"{pad}if y{i} < 0.0: y{i} = 0.0",
+                f"{pad}elif y{i} > max_y: y{i} = max_y"]
+    
+    lines = ["def step(xs, ys, old_xs, old_ys, striker_x, striker_y, collision_distance,",
+             "         damping, drop, segment_length, iterations, min_x, max_x, max_y):",
+             "    reach_sq = collision_distance * collision_distance",
+             "    length_sq = segment_length * segment_length",
+             "    rest_tolerance_sq = REST_TOLERANCE * REST_TOLERANCE * length_sq",
+             "    xs[0] = old_xs[0] = x0 = striker_x",
+             "    ys[0] = old_ys[0] = y0 = striker_y"]
+    for i in range(1, n):
+        lines += [f"    x = xs[{i}]; y = ys[{i}]",
+                  f"    x{i} = x + (x - old_xs[{i}]) * damping",
+                  f"    y{i} = y + (y - old_ys[{i}]) * damping + drop",
+                  f"    old_xs[{i}] = x; old_ys[{i}] = y"]
+        lines += clamp(i, 4)
+    lines.append("    for _ in range(iterations):")
+    for i in range(n - 1):
+        j = i + 1
+        lines += [f"        dx = x{j} - x{i}; dy = y{j} - y{i}",
+                  "        dist_sq = dx * dx + dy * dy",
+                  "        if abs(dist_sq - length_sq) >= rest_tolerance_sq:",
+                  "            inv_distance = 1.0 / sqrt(dist_sq) if dist_sq > 0.0001 else 100.0",
+                  "            difference = (segment_length * inv_distance - 1.0) * 0.5",
+                  "            offset_x = dx * difference; offset_y = dy * difference"]
+        if i > 0:
+            lines.append(f"            x{i} -= offset_x; y{i} -= offset_y")
+        lines.append(f"            x{j} += offset_x; y{j} += offset_y")
+    for i in range(1, n):
+        lines += [f"        dx = x{i} - striker_x; dy = y{i} - striker_y",
+                  "        dist_sq = dx * dx + dy * dy",
+                  "        if 0.0001 < dist_sq < reach_sq:",
+                  "            push = collision_distance / sqrt(dist_sq) - 1.0",
+                  f"            x{i} += dx * push; y{i} += dy * push"]
+        lines += clamp(i, 8)
+    if n > 1:
+        lines += ["    xs[1:] = [" + ", ".join(f"x{i}" for i in range(1, n)) + "]",
+                  "    ys[1:] = [" + ", ".join(f"y{i}" for i in range(1, n)) + "]"]
+    return "\n".join(lines) + "\n"
+
+
+def get_step(num_points):
+    """
+    The step_chain implementation to use for a chain of num_points points: the numba
+    kernel, else the Cython build if present, else a plain-Python version unrolled for that size
+    """
+    if NUMBA_AVAILABLE:
+        return step_chain
+    if CYTHON_STEP_AVAILABLE:
+        return cython_step_chain
+    step = _unrolled_steps.get(num_points)
+    if step is None:
+        namespace = {'sqrt': sqrt, 'REST_TOLERANCE': REST_TOLERANCE}
+        exec(compile(_unrolled_source(num_points), f"<step_chain unrolled x{num_points}>", 'exec'), namespace)
+        step = _unrolled_steps[num_points] = namespace['step']
+    return step
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load the cached build) now rather than on the first game frame
+    _warm = coordinate_array([0.0, 1.0])
+    step_chain(_warm, _warm.copy(), _warm.copy(), _warm.copy(), 0.0, 0.0, 1.0,
+               0.98, 0.0, 1.0, 1, 0.0, 10.0, 10.0)
+    del _warm
@@ -0,0 +1,95 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython build of chain_kernel.step_chain, for platforms without numba.
+Build in place with: cythonize -i chainhockey/chain_step.pyx
+"""
+
+from libc.math cimport sqrt, fabs
+
+# Must match chain_kernel.REST_TOLERANCE
+cdef double REST_TOLERANCE = 0.02
+
+
+def step_chain(double[::1] xs, double[::1] ys, double[::1] old_xs, double[::1] old_ys,
+               double striker_x, double striker_y, double collision_distance,
+               double damping, double drop, double segment_length, int iterations,
+               double min_x, double max_x, double max_y):
+    """step_chain over double buffers (array.array('d') or float64 arrays), same update order"""
+    cdef Py_ssize_t n = xs.shape[0]
+    cdef Py_ssize_t i
+    cdef int k
+    cdef double x, y, dx, dy, dist_sq, inv_distance, difference, offset_x, offset_y, push
+    cdef double reach_sq = collision_distance * collision_distance
+    cdef double length_sq = segment_length * segment_length
+    cdef double rest_tolerance_sq = REST_TOLERANCE * REST_TOLERANCE * length_sq
+
+    # Pin first segment to striker; it keeps no velocity of its own
+    xs[0] = striker_x
+    ys[0] = striker_y
+    old_xs[0] = striker_x
+    old_ys[0] = striker_y
+
+    # Verlet step for all other segments (velocity from position history, plus gravity)
+    for i in range(1, n):
+        x = xs[i]
+        y = ys[i]
+        x += (x - old_xs[i]) * damping
+        y += (y - old_ys[i]) * damping + drop
+        old_xs[i] = xs[i]
+        old_ys[i] = ys[i]
+        if x < min_x:
+            x = min_x
+        elif x > max_x:
+            x = max_x
+        if y < 0.0:
+            y = 0.0
+        elif y > max_y:
+            y = max_y
+        xs[i] = x
+        ys[i] = y
+
+    for k in range(iterations):
+        # Distance constraints, first segment to last
+        for i in range(n - 1):
+            dx = xs[i + 1] - xs[i]
+            dy = ys[i + 1] - ys[i]
+            dist_sq = dx * dx + dy * dy
+
+            # Pairs already at rest length need no correction
+            if fabs(dist_sq - length_sq) < rest_tolerance_sq:
+                continue
+
+            # One root per pair; near-coincident points use the 0.01 floor distance
+            inv_distance = 1.0 / sqrt(dist_sq) if dist_sq > 0.0001 else 100.0
+
+            # Move each end half the relative length error, in opposite directions
+            difference = (segment_length * inv_distance - 1.0) * 0.5
+            offset_x = dx * difference
+            offset_y = dy * difference
+            if i > 0:
+                xs[i] -= offset_x
+                ys[i] -= offset_y
+            xs[i + 1] += offset_x
+            ys[i + 1] += offset_y
+
+        # Push segments out of the striker, then back inside the bounds
+        for i in range(1, n):
+            x = xs[i]
+            y = ys[i]
+            dx = x - striker_x
+            dy = y - striker_y
+            dist_sq = dx * dx + dy * dy
+            if 0.0001 < dist_sq < reach_sq:
+                push = collision_distance / sqrt(dist_sq) - 1.0
+                x += dx * push
+                y += dy * push
+            if x < min_x:
+                x = min_x
+            elif x > max_x:
+                x = max_x
+            if y < 0.0:
+                y = 0.0
+            elif y > max_y:
+                y = max_y
+            xs[i] = x
+            ys[i] = y
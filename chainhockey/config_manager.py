@@ -10,7 +10,7 @@ from .config import (
     STRIKER_RADIUS, STRIKER_COLOR, HAMMER_RADIUS, HAMMER_COLOR,
     STRIKER_MASS, HAMMER_MASS, STRIKER_SPEED,
     CHAIN_SEGMENTS, SEGMENT_LENGTH, CHAIN1_COLOR, CHAIN2_COLOR, CHAIN_THICKNESS,
-    DAMPING, GRAVITY, CONSTRAINT_ITERATIONS,
+    DAMPING, GRAVITY, CONSTRAINT_ITERATIONS, LEGACY_CONSTRAINT_ITERATIONS, PHYSICS_SUBSTEPS,
     PUCK_FRICTION, PUCK_WALL_BOUNCE,
     GAME_DURATION_SECONDS, MAX_GOALS
 )
@@ -66,6 +66,7 @@ class GameConfig:
     # Global physics
     gravity: float = GRAVITY
     constraint_iterations: int = CONSTRAINT_ITERATIONS
+    physics_substeps: int = PHYSICS_SUBSTEPS
     puck_friction: float = PUCK_FRICTION
     puck_wall_bounce: float = PUCK_WALL_BOUNCE
     
@@ -81,6 +82,7 @@ class GameConfig:
             'global': {
                 'gravity': self.gravity,
                 'constraint_iterations': self.constraint_iterations,
+                'physics_substeps': self.physics_substeps,
                 'puck_friction': self.puck_friction,
                 'puck_wall_bounce': self.puck_wall_bounce,
                 'game_duration_seconds': self.game_duration_seconds,
@@ -95,11 +97,18 @@ class GameConfig:
         player2 = PlayerConfig.from_dict(data.get('player2', {}))
         global_data = data.get('global', {})
         
+        # Configs saved before chain substepping gave all iterations to one pass; their
+        # untouched old default would now cost more than the new default for a chain no stiffer
+        constraint_iterations = global_data.get('constraint_iterations', CONSTRAINT_ITERATIONS)
+        if 'physics_substeps' not in global_data and constraint_iterations == LEGACY_CONSTRAINT_ITERATIONS:
+            constraint_iterations = CONSTRAINT_ITERATIONS
+        
         return cls(
             player1=player1,
             player2=player2,
             gravity=global_data.get('gravity', GRAVITY),
-            constraint_iterations=global_data.get('constraint_iterations', CONSTRAINT_ITERATIONS),
+            constraint_iterations=constraint_iterations,
+            physics_substeps=global_data.get('physics_substeps', PHYSICS_SUBSTEPS),
             puck_friction=global_data.get('puck_friction', PUCK_FRICTION),
             puck_wall_bounce=global_data.get('puck_wall_bounce', PUCK_WALL_BOUNCE),
             game_duration_seconds=global_data.get('game_duration_seconds', GAME_DURATION_SECONDS),
@@ -119,6 +128,9 @@ class ConfigManager:
         self.config_file = config_file
         self.config = GameConfig.default()
         self._web_storage_key = 'chainhockey_config'
+        # Parsed contents of config_file, reused while its mtime is unchanged
+        self._file_mtime = None
+        self._file_data = None
     
     def _load_from_web(self):
         """Load configuration from browser localStorage"""
@@ -153,10 +165,13 @@ class ConfigManager:
             # Desktop: load from file
             if os.path.exists(self.config_file):
                 try:
-                    with open(self.config_file, 'r') as f:
-                        data = json.load(f)
-                        self.config = GameConfig.from_dict(data)
-                        return True
+                    mtime = os.path.getmtime(self.config_file)
+                    if mtime != self._file_mtime:
+                        with open(self.config_file, 'r') as f:
+                            self._file_data = json.load(f)
+                        self._file_mtime = mtime
+                    self.config = GameConfig.from_dict(self._file_data)
+                    return True
                 except (json.JSONDecodeError, KeyError, ValueError) as e:
                     print(f"Error loading config: {e}. Using defaults.")
                     self.config = GameConfig.default()
@@ -175,6 +190,8 @@ class ConfigManager:
             try:
                 with open(self.config_file, 'w') as f:
                     json.dump(self.config.to_dict(), f, indent=2)
+                # Coarse mtime resolution could hide this write from load()
+                self._file_mtime = None
                 return True
             except IOError as e:
                 print(f"Error saving config: {e}")
@@ -5,7 +5,7 @@ Main game loop and game state management.
 import pygame
 import sys
 from enum import Enum
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from .config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, FPS, BLACK, WHITE, GRAY,
     GOAL_COLOR, GOAL_LEFT_X, GOAL_RIGHT_X, GOAL_Y, GOAL_WIDTH, GOAL_HEIGHT,
@@ -14,10 +14,13 @@ from .config import (
 )
 from .chain import Chain
 from .game_objects import Striker, Hammer, Puck
-from .physics import check_collision_circle, resolve_collision, separate_circles
+from .physics import Bodies, collide_with_bodies
 from .config_manager import GameConfig
-from .network import NetworkClient, ConnectionState
-from .network_sync import NetworkSync
+from .ui import get_font, render_cached
+
+if TYPE_CHECKING:
+    # Networking (and websockets) is only loaded once multiplayer is used
+    from .network_sync import NetworkSync
 
 
 class GameState(Enum):
@@ -28,13 +31,35 @@ class GameState(Enum):
     OPTIONS = "options"
 
 
+# Entries of the game's Bodies table; the puck meets the others in this order
+PUCK, HAMMER1, HAMMER2, STRIKER1, STRIKER2 = range(5)
+
+
+class RemoteKeys:
+    """pygame.key.get_pressed()-style lookup over a remote player's {'w', 'a', 's', 'd'} flags"""
+    
+    __slots__ = ('_pressed',)
+    
+    _NAMES = {pygame.K_w: 'w', pygame.K_a: 'a', pygame.K_s: 's', pygame.K_d: 'd'}
+    
+    def __init__(self, keys_dict):
+        self._pressed = keys_dict
+    
+    def __getitem__(self, key):
+        name = self._NAMES.get(key)
+        return self._pressed.get(name, False) if name else False
+
+
 class ChainHockeyGame:
     """Main game class managing the game loop and state"""
     
     def __init__(self, config: GameConfig):
-        # Set up the display
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Chain Hockey - Meteor Hammer")
+        # Reuse the display created by the entry point; re-calling set_mode
+        # would tear down and rebuild the window's backing surface/renderer
+        self.screen = pygame.display.get_surface()
+        if self.screen is None:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption("Chain Hockey - Meteor Hammer")
         
         # Clock for controlling frame rate
         self.clock = pygame.time.Clock()
@@ -46,9 +71,11 @@ class ChainHockeyGame:
         self.state = GameState.MENU
         self.running = True
         self.dt = 1.0  # Delta time for physics
+        self._paused_screen = None  # Frozen game frame shown behind the pause menu
+        self._game_over_overlay = None  # Dimming layer for the game over screen, built on first use
         
         # Network/multiplayer
-        self.network_sync: Optional[NetworkSync] = None
+        self.network_sync: Optional['NetworkSync'] = None
         self.is_multiplayer = False
         self.is_host = False  # Player 1 is host in multiplayer
         self.remote_player_input = {}  # Store remote player input
@@ -90,11 +117,15 @@ class ChainHockeyGame:
         self.player2_min_x = p2_config.striker_radius
         self.player2_max_x = CENTER_LINE_X - p2_config.striker_radius
         
+        # Positions and velocities of every body, shared for collide_with_bodies
+        self.bodies = Bodies(5)
+        
         # Create Player 1 (right side, mouse controlled)
         self.striker1 = Striker(PLAYER1_SPAWN_X, PLAYER_SPAWN_Y, 
                                p1_config.striker_radius, p1_config.striker_color,
                                self.player1_min_x, self.player1_max_x, 
-                               is_player1=True, speed=p1_config.striker_speed)
+                               is_player1=True, speed=p1_config.striker_speed,
+                               bodies=self.bodies, index=STRIKER1)
         self.striker1.vel_x = 0
         self.striker1.vel_y = 0
         self.striker1.prev_x = self.striker1.x
@@ -104,7 +135,8 @@ class ChainHockeyGame:
         self.striker2 = Striker(PLAYER2_SPAWN_X, PLAYER_SPAWN_Y,
                                p2_config.striker_radius, p2_config.striker_color,
                                self.player2_min_x, self.player2_max_x, 
-                               is_player1=False, speed=p2_config.striker_speed)
+                               is_player1=False, speed=p2_config.striker_speed,
+                               bodies=self.bodies, index=STRIKER2)
         self.striker2.vel_x = 0
         self.striker2.vel_y = 0
         self.striker2.prev_x = self.striker2.x
@@ -124,17 +156,26 @@ class ChainHockeyGame:
         hammer1_x, hammer1_y = self.chain1.get_hammer_position()
         self.hammer1 = Hammer(hammer1_x, hammer1_y, p1_config.hammer_radius, 
                               p1_config.hammer_color,
-                              self.player1_min_x, self.player1_max_x)
+                              self.player1_min_x, self.player1_max_x,
+                              bodies=self.bodies, index=HAMMER1)
         hammer2_x, hammer2_y = self.chain2.get_hammer_position()
         self.hammer2 = Hammer(hammer2_x, hammer2_y, p2_config.hammer_radius,
                               p2_config.hammer_color,
-                              self.player2_min_x, self.player2_max_x)
+                              self.player2_min_x, self.player2_max_x,
+                              bodies=self.bodies, index=HAMMER2)
         
         # Create puck
         self.puck = Puck(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, 
                         PUCK_RADIUS, PUCK_COLOR,
                         friction=self.config.puck_friction,
-                        wall_bounce=self.config.puck_wall_bounce)
+                        wall_bounce=self.config.puck_wall_bounce,
+                        bodies=self.bodies, index=PUCK)
+        
+        # High restitution for hammers (power hit), low for strikers (controlled hit)
+        self.hammer1.set_collision(p1_config.hammer_mass, 1.2, recoil=False)
+        self.hammer2.set_collision(p2_config.hammer_mass, 1.2, recoil=False)
+        self.striker1.set_collision(p1_config.striker_mass, 0.4)
+        self.striker2.set_collision(p2_config.striker_mass, 0.4)
         
         # Reset game state
         self.player1_score = 0
@@ -151,7 +192,7 @@ class ChainHockeyGame:
         """Reset game state without reinitializing display"""
         self.start_game()
     
-    def set_multiplayer(self, network_sync: NetworkSync, is_host: bool):
+    def set_multiplayer(self, network_sync: 'NetworkSync', is_host: bool):
         """Enable multiplayer mode with network sync"""
         self.network_sync = network_sync
         self.is_multiplayer = True
@@ -187,14 +228,15 @@ class ChainHockeyGame:
                 # Could apply remote state for reconciliation
                 pass
     
-    def _send_player_input(self):
-        """Send local player input to network"""
+    def _send_player_input(self, mouse_pos=None, keys=None):
+        """Send local player input to network (pass whatever input this frame already polled)"""
         if not self.network_sync or not self.is_multiplayer:
             return
         
         # Get current input state
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        keys = pygame.key.get_pressed()
+        mouse_x, mouse_y = mouse_pos if mouse_pos is not None else pygame.mouse.get_pos()
+        if keys is None:
+            keys = pygame.key.get_pressed()
         
         input_data = {
             'mouse_x': mouse_x,
@@ -308,78 +350,41 @@ class ChainHockeyGame:
         if self.is_multiplayer:
             # Player 1: local input (mouse)
             if self.is_host or (not self.is_host and self.network_sync and self.network_sync.player_num == 1):
-                mouse_x, mouse_y = pygame.mouse.get_pos()
-                self.striker1.prev_x = self.striker1.x
-                self.striker1.prev_y = self.striker1.y
-                self.striker1.update_position_mouse(mouse_x, mouse_y)
-                self.striker1.vel_x = self.striker1.x - self.striker1.prev_x
-                self.striker1.vel_y = self.striker1.y - self.striker1.prev_y
+                mouse_pos = pygame.mouse.get_pos()
+                self.striker1.update_position_mouse(*mouse_pos)
                 # Send input to network
-                self._send_player_input()
+                self._send_player_input(mouse_pos=mouse_pos)
             else:
                 # Apply remote input for Player 1
                 if 1 in self.remote_player_input:
                     remote_input = self.remote_player_input[1]
-                    self.striker1.prev_x = self.striker1.x
-                    self.striker1.prev_y = self.striker1.y
                     self.striker1.update_position_mouse(remote_input.get('mouse_x', self.striker1.x),
                                                        remote_input.get('mouse_y', self.striker1.y))
-                    self.striker1.vel_x = self.striker1.x - self.striker1.prev_x
-                    self.striker1.vel_y = self.striker1.y - self.striker1.prev_y
             
             # Player 2: local or remote input
             if (not self.is_host and self.network_sync and self.network_sync.player_num == 2) or \
                (self.is_host and not self.is_multiplayer):
                 # Local WASD control
                 keys = pygame.key.get_pressed()
-                self.striker2.prev_x = self.striker2.x
-                self.striker2.prev_y = self.striker2.y
                 self.striker2.update_position_keyboard(keys)
-                self.striker2.vel_x = self.striker2.x - self.striker2.prev_x
-                self.striker2.vel_y = self.striker2.y - self.striker2.prev_y
                 # Send input to network
                 if self.is_multiplayer:
-                    self._send_player_input()
+                    self._send_player_input(keys=keys)
             else:
                 # Apply remote input for Player 2
                 if 2 in self.remote_player_input:
                     remote_input = self.remote_player_input[2]
-                    keys_dict = remote_input.get('keys', {})
-                    # Create a mock keys object
-                    class MockKeys:
-                        def __getitem__(self, key):
-                            if key == pygame.K_w:
-                                return keys_dict.get('w', False)
-                            elif key == pygame.K_a:
-                                return keys_dict.get('a', False)
-                            elif key == pygame.K_s:
-                                return keys_dict.get('s', False)
-                            elif key == pygame.K_d:
-                                return keys_dict.get('d', False)
-                            return False
-                    mock_keys = MockKeys()
-                    self.striker2.prev_x = self.striker2.x
-                    self.striker2.prev_y = self.striker2.y
+                    mock_keys = RemoteKeys(remote_input.get('keys', {}))
                     self.striker2.update_position_keyboard(mock_keys)
-                    self.striker2.vel_x = self.striker2.x - self.striker2.prev_x
-                    self.striker2.vel_y = self.striker2.y - self.striker2.prev_y
         else:
             # Single player mode (original behavior)
             # Get mouse position and update Player 1 (mouse controlled)
             mouse_x, mouse_y = pygame.mouse.get_pos()
-            self.striker1.prev_x = self.striker1.x
-            self.striker1.prev_y = self.striker1.y
             self.striker1.update_position_mouse(mouse_x, mouse_y)
-            self.striker1.vel_x = self.striker1.x - self.striker1.prev_x
-            self.striker1.vel_y = self.striker1.y - self.striker1.prev_y
             
             # Update Player 2 (WASD controlled)
             keys = pygame.key.get_pressed()
-            self.striker2.prev_x = self.striker2.x
-            self.striker2.prev_y = self.striker2.y
             self.striker2.update_position_keyboard(keys)
-            self.striker2.vel_x = self.striker2.x - self.striker2.prev_x
-            self.striker2.vel_y = self.striker2.y - self.striker2.prev_y
         
         # Update chain physics
         p1_config = self.config.player1
@@ -388,12 +393,14 @@ class ChainHockeyGame:
                           self.striker1.radius, self.player1_min_x, self.player1_max_x,
                           damping=p1_config.chain_damping,
                           gravity=self.config.gravity,
-                          constraint_iterations=self.config.constraint_iterations)
+                          constraint_iterations=self.config.constraint_iterations,
+                          substeps=self.config.physics_substeps)
         self.chain2.update(self.dt, self.striker2.x, self.striker2.y,
                           self.striker2.radius, self.player2_min_x, self.player2_max_x,
                           damping=p2_config.chain_damping,
                           gravity=self.config.gravity,
-                          constraint_iterations=self.config.constraint_iterations)
+                          constraint_iterations=self.config.constraint_iterations,
+                          substeps=self.config.physics_substeps)
         
         # Update hammer positions based on chains
         hammer1_x, hammer1_y = self.chain1.get_hammer_position()
@@ -429,81 +436,9 @@ class ChainHockeyGame:
     
     def handle_collisions(self):
         """Handle collisions between game objects"""
-        # Collision detection: Puck vs Hammer 1
-        if check_collision_circle(self.puck.x, self.puck.y, self.puck.radius, 
-                                 self.hammer1.x, self.hammer1.y, self.hammer1.radius):
-            # Separate objects first
-            self.puck.x, self.puck.y, hammer_x, hammer_y = separate_circles(
-                self.puck.x, self.puck.y, self.puck.radius,
-                self.hammer1.x, self.hammer1.y, self.hammer1.radius
-            )
-            
-            # Resolve collision with momentum transfer
-            p1_config = self.config.player1
-            self.puck.vel_x, self.puck.vel_y, _, _ = resolve_collision(
-                self.puck.x, self.puck.y, self.puck.vel_x, self.puck.vel_y, 
-                self.puck.radius, PUCK_MASS,
-                self.hammer1.x, self.hammer1.y, self.hammer1.vel_x, self.hammer1.vel_y, 
-                self.hammer1.radius, p1_config.hammer_mass,
-                restitution=1.2  # High restitution for hammer (power hit)
-            )
-        
-        # Collision detection: Puck vs Hammer 2
-        if check_collision_circle(self.puck.x, self.puck.y, self.puck.radius, 
-                                 self.hammer2.x, self.hammer2.y, self.hammer2.radius):
-            # Separate objects first
-            self.puck.x, self.puck.y, hammer_x, hammer_y = separate_circles(
-                self.puck.x, self.puck.y, self.puck.radius,
-                self.hammer2.x, self.hammer2.y, self.hammer2.radius
-            )
-            
-            # Resolve collision with momentum transfer
-            p2_config = self.config.player2
-            self.puck.vel_x, self.puck.vel_y, _, _ = resolve_collision(
-                self.puck.x, self.puck.y, self.puck.vel_x, self.puck.vel_y, 
-                self.puck.radius, PUCK_MASS,
-                self.hammer2.x, self.hammer2.y, self.hammer2.vel_x, self.hammer2.vel_y, 
-                self.hammer2.radius, p2_config.hammer_mass,
-                restitution=1.2  # High restitution for hammer (power hit)
-            )
-        
-        # Collision detection: Puck vs Striker 1
-        if check_collision_circle(self.puck.x, self.puck.y, self.puck.radius, 
-                                 self.striker1.x, self.striker1.y, self.striker1.radius):
-            # Separate objects first
-            self.puck.x, self.puck.y, self.striker1.x, self.striker1.y = separate_circles(
-                self.puck.x, self.puck.y, self.puck.radius,
-                self.striker1.x, self.striker1.y, self.striker1.radius
-            )
-            
-            # Resolve collision with momentum transfer
-            p1_config = self.config.player1
-            self.puck.vel_x, self.puck.vel_y, self.striker1.vel_x, self.striker1.vel_y = resolve_collision(
-                self.puck.x, self.puck.y, self.puck.vel_x, self.puck.vel_y, 
-                self.puck.radius, PUCK_MASS,
-                self.striker1.x, self.striker1.y, self.striker1.vel_x, self.striker1.vel_y, 
-                self.striker1.radius, p1_config.striker_mass,
-                restitution=0.4  # Low restitution for striker (controlled hit)
-            )
-        
-        # Collision detection: Puck vs Striker 2
-        if check_collision_circle(self.puck.x, self.puck.y, self.puck.radius, 
-                                 self.striker2.x, self.striker2.y, self.striker2.radius):
-            # Separate objects first
-            self.puck.x, self.puck.y, self.striker2.x, self.striker2.y = separate_circles(
-                self.puck.x, self.puck.y, self.puck.radius,
-                self.striker2.x, self.striker2.y, self.striker2.radius
-            )
-            
-            # Resolve collision with momentum transfer
-            p2_config = self.config.player2
-            self.puck.vel_x, self.puck.vel_y, self.striker2.vel_x, self.striker2.vel_y = resolve_collision(
-                self.puck.x, self.puck.y, self.puck.vel_x, self.puck.vel_y, 
-                self.puck.radius, PUCK_MASS,
-                self.striker2.x, self.striker2.y, self.striker2.vel_x, self.striker2.vel_y, 
-                self.striker2.radius, p2_config.striker_mass,
-                restitution=0.4  # Low restitution for striker (controlled hit)
-            )
+        # Puck against hammers then strikers; hammers stay where their chain put
+        # them and take no recoil, strikers take both
+        collide_with_bodies(self.bodies.table, PUCK)
     
     def get_time_remaining(self):
         """Get remaining time in seconds"""
@@ -569,49 +504,49 @@ class ChainHockeyGame:
         self.hammer1.draw(self.screen)
         self.hammer2.draw(self.screen)
         
-        # Draw score
-        score_font = pygame.font.Font(None, 72)
-        score_text = score_font.render(f"{self.player1_score}  -  {self.player2_score}", True, WHITE)
+        # Draw score (text surfaces are rendered once per distinct string and reused)
+        score_font = get_font(72)
+        score_text = render_cached(score_font, f"{self.player1_score}  -  {self.player2_score}", WHITE)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 40))
         self.screen.blit(score_text, score_rect)
         
         # Draw timer
         time_remaining = self.get_time_remaining()
-        time_text = score_font.render(self.format_time(time_remaining), True, WHITE)
+        time_text = render_cached(score_font, self.format_time(time_remaining), WHITE)
         time_rect = time_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
         self.screen.blit(time_text, time_rect)
         
         # Draw instructions
-        font = pygame.font.Font(None, 24)
+        font = get_font(24)
         if not self.game_over:
-            instructions = font.render("P1: Mouse | P2: WASD | SPACE: Reset puck | ESC: Pause", True, GRAY)
+            instructions = render_cached(font, "P1: Mouse | P2: WASD | SPACE: Reset puck | ESC: Pause", GRAY)
             self.screen.blit(instructions, (10, 10))
         else:
             # Draw game over screen
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(200)
-            overlay.fill(BLACK)
-            self.screen.blit(overlay, (0, 0))
+            if self._game_over_overlay is None:
+                self._game_over_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+                self._game_over_overlay.set_alpha(200)
+                self._game_over_overlay.fill(BLACK)
+            self.screen.blit(self._game_over_overlay, (0, 0))
             
-            game_over_font = pygame.font.Font(None, 96)
+            game_over_font = get_font(96)
             p1_config = self.config.player1
             p2_config = self.config.player2
             if self.winner == 1:
-                winner_text = game_over_font.render("Player 1 Wins!", True, p1_config.striker_color)
+                winner_text = render_cached(game_over_font, "Player 1 Wins!", tuple(p1_config.striker_color))
             elif self.winner == 2:
-                winner_text = game_over_font.render("Player 2 Wins!", True, p2_config.striker_color)
+                winner_text = render_cached(game_over_font, "Player 2 Wins!", tuple(p2_config.striker_color))
             else:
-                winner_text = game_over_font.render("Tie Game!", True, WHITE)
+                winner_text = render_cached(game_over_font, "Tie Game!", WHITE)
             
             winner_rect = winner_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
             self.screen.blit(winner_text, winner_rect)
             
-            restart_text = font.render("Press SPACE to restart or ESC to quit", True, WHITE)
+            restart_text = render_cached(font, "Press SPACE to restart or ESC to quit", WHITE)
             restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
             self.screen.blit(restart_text, restart_rect)
         
-        # Update display
-        pygame.display.flip()
+        # The caller's loop presents the frame (one flip per frame)
     
     def update_game(self):
         """Update game state (only when playing)"""
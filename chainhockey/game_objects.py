@@ -2,42 +2,103 @@
 Game objects: Striker, Hammer, and Puck.
 """
 
+import math
 import pygame
 from .config import (
     STRIKER_RADIUS, STRIKER_COLOR, HAMMER_RADIUS, HAMMER_COLOR,
     PUCK_RADIUS, PUCK_COLOR, SCREEN_WIDTH, SCREEN_HEIGHT,
     GOAL_WIDTH, GOAL_HEIGHT, GOAL_Y, PUCK_FRICTION, PUCK_WALL_BOUNCE,
-    WHITE, STRIKER_SPEED, CENTER_LINE_X
+    WHITE, STRIKER_SPEED, CENTER_LINE_X, STRIKER_MASS, HAMMER_MASS, PUCK_MASS
 )
 from typing import Optional
+from .ui import display_ready
+from .physics import (
+    Bodies, body_property, BODY_X, BODY_Y, BODY_VEL_X, BODY_VEL_Y,
+    BODY_RADIUS, BODY_INV_MASS, BODY_RESTITUTION, BODY_RECOIL
+)
 
+# Lower edge of the goal mouths
+GOAL_BOTTOM = GOAL_Y + GOAL_HEIGHT
 
-class Striker:
-    """Player-controlled striker that can be controlled by mouse or keyboard"""
+
+def circle_sprite(layers):
+    """
+    Pre-render concentric circles, given as (color, radius, width) layers drawn in order,
+    onto a transparent surface. Returns (surface, offset): blit the surface at
+    (x - offset, y - offset) to get the same pixels as drawing the layers at (x, y)
+    """
+    offset = int(math.ceil(max(radius for _, radius, _ in layers))) + 1
+    surf = pygame.Surface((2 * offset + 1, 2 * offset + 1), pygame.SRCALPHA)
+    for color, radius, width in layers:
+        pygame.draw.circle(surf, color, (offset, offset), radius, width)
+    return display_ready(surf), offset
+
+
+class Body:
+    """Base for circular bodies whose position and velocity live in a (possibly shared) Bodies table"""
     
-    def __init__(self, x, y, radius=STRIKER_RADIUS, color=STRIKER_COLOR, 
-                 min_x=None, max_x=None, is_player1=True, speed: Optional[float] = None):
+    x = body_property(BODY_X)
+    y = body_property(BODY_Y)
+    vel_x = body_property(BODY_VEL_X)
+    vel_y = body_property(BODY_VEL_Y)
+    
+    def _bind(self, bodies, index, x, y):
+        """Take entry `index` of bodies (a table of its own if None) and fill in the starting state"""
+        if bodies is None:
+            bodies, index = Bodies(1), 0
+        self.bodies = bodies
+        self.index = index
+        self._body_rows = bodies.rows
+        self._body_index = index
         self.x = x
         self.y = y
-        self.radius = radius
-        self.color = color
         self.vel_x = 0
         self.vel_y = 0
+        self._body_rows[BODY_RADIUS][index] = self.radius
+    
+    def _move_to(self, x, y):
+        """Move to (x, y), remembering the old position in prev_x/prev_y and taking the displacement as velocity"""
+        self.prev_x, self.prev_y = prev_x, prev_y = self.x, self.y
+        self.x, self.y, self.vel_x, self.vel_y = x, y, x - prev_x, y - prev_y
+    
+    def set_collision(self, mass, restitution, recoil=True):
+        """Mass, restitution of hits against this body, and whether hits move it (see collide_with_bodies)"""
+        rows, index = self._body_rows, self._body_index
+        rows[BODY_INV_MASS][index] = 1.0 / mass
+        rows[BODY_RESTITUTION][index] = restitution
+        rows[BODY_RECOIL][index] = 1.0 if recoil else 0.0
+
+
+class Striker(Body):
+    """Player-controlled striker that can be controlled by mouse or keyboard"""
+    
+    def __init__(self, x, y, radius=STRIKER_RADIUS, color=STRIKER_COLOR, 
+                 min_x=None, max_x=None, is_player1=True, speed: Optional[float] = None,
+                 bodies: Optional[Bodies] = None, index: int = 0):
+        self.radius = radius
+        self._bind(bodies, index, x, y)
+        self.set_collision(STRIKER_MASS, 1.0)
+        self.color = color
         self.prev_x = x
         self.prev_y = y
         self.min_x = min_x if min_x is not None else self.radius
         self.max_x = max_x if max_x is not None else SCREEN_WIDTH - self.radius
         self.is_player1 = is_player1
         self.speed = speed if speed is not None else STRIKER_SPEED
+        # Body with a white outline for better visibility
+        self._sprite, self._sprite_offset = circle_sprite([
+            (self.color, self.radius, 0),
+            (WHITE, self.radius, 2),
+        ])
     
     def update_position_mouse(self, mouse_x, mouse_y):
-        """Update striker position to follow mouse, keeping it within bounds"""
+        """Update striker position to follow mouse, keeping it within bounds, and calculate velocity"""
         # Keep striker within screen boundaries and player's half
-        self.x = max(self.min_x, min(mouse_x, self.max_x))
-        self.y = max(self.radius, min(mouse_y, SCREEN_HEIGHT - self.radius))
+        self._move_to(max(self.min_x, min(mouse_x, self.max_x)),
+                      max(self.radius, min(mouse_y, SCREEN_HEIGHT - self.radius)))
     
     def update_position_keyboard(self, keys):
-        """Update striker position based on keyboard input (WASD)"""
+        """Update striker position based on keyboard input (WASD) and calculate velocity"""
         dx = 0
         dy = 0
         
@@ -55,108 +116,146 @@ class Striker:
         new_y = self.y + dy
         
         # Constrain to boundaries and player's half
-        self.x = max(self.min_x, min(new_x, self.max_x))
-        self.y = max(self.radius, min(new_y, SCREEN_HEIGHT - self.radius))
+        self._move_to(max(self.min_x, min(new_x, self.max_x)),
+                      max(self.radius, min(new_y, SCREEN_HEIGHT - self.radius)))
     
     def draw(self, screen):
         """Draw the striker on the screen"""
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
-        # Draw a white outline for better visibility
-        pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y)), self.radius, 2)
+        offset = self._sprite_offset
+        screen.blit(self._sprite, (int(self.x) - offset, int(self.y) - offset))
 
 
-class Hammer:
+class Hammer(Body):
     """Hammer attached to the end of the chain"""
     
-    def __init__(self, x, y, radius=HAMMER_RADIUS, color=HAMMER_COLOR, min_x=None, max_x=None):
-        self.x = x
-        self.y = y
+    def __init__(self, x, y, radius=HAMMER_RADIUS, color=HAMMER_COLOR, min_x=None, max_x=None,
+                 bodies: Optional[Bodies] = None, index: int = 0):
         self.radius = radius
+        self._bind(bodies, index, x, y)
+        self.set_collision(HAMMER_MASS, 1.0, recoil=False)  # Stays where its chain puts it
         self.color = color
-        self.vel_x = 0
-        self.vel_y = 0
         self.prev_x = x
         self.prev_y = y
         self.min_x = min_x if min_x is not None else self.radius
         self.max_x = max_x if max_x is not None else SCREEN_WIDTH - self.radius
+        # Main body, white outline and inner detail circle
+        self._sprite, self._sprite_offset = circle_sprite([
+            (self.color, self.radius, 0),
+            (WHITE, self.radius, 3),
+            ((255, 180, 100), self.radius - 10, 2),
+        ])
     
     def update_position(self, x, y):
         """Update hammer position based on chain and calculate velocity"""
-        self.prev_x = self.x
-        self.prev_y = self.y
-        
         # Constrain hammer to player's half
-        self.x = max(self.min_x, min(x, self.max_x))
-        self.y = max(self.radius, min(y, SCREEN_HEIGHT - self.radius))
-        
-        # Calculate velocity from position change
-        self.vel_x = self.x - self.prev_x
-        self.vel_y = self.y - self.prev_y
+        self._move_to(max(self.min_x, min(x, self.max_x)),
+                      max(self.radius, min(y, SCREEN_HEIGHT - self.radius)))
     
     def draw(self, screen):
         """Draw the hammer on the screen"""
-        # Draw main hammer body
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
-        # Draw darker outline
-        pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y)), self.radius, 3)
-        # Draw inner detail circle
-        pygame.draw.circle(screen, (255, 180, 100), (int(self.x), int(self.y)), self.radius - 10, 2)
+        offset = self._sprite_offset
+        screen.blit(self._sprite, (int(self.x) - offset, int(self.y) - offset))
 
 
-class Puck:
+class Puck(Body):
     """The puck that players try to score with"""
     
     def __init__(self, x, y, radius=PUCK_RADIUS, color=PUCK_COLOR,
-                 friction: Optional[float] = None, wall_bounce: Optional[float] = None):
-        self.x = x
-        self.y = y
+                 friction: Optional[float] = None, wall_bounce: Optional[float] = None,
+                 bodies: Optional[Bodies] = None, index: int = 0):
         self.radius = radius
+        self._bind(bodies, index, x, y)
+        self.set_collision(PUCK_MASS, 1.0)
         self.color = color
-        self.vel_x = 0
-        self.vel_y = 0
         self.friction = friction if friction is not None else PUCK_FRICTION
         self.wall_bounce = wall_bounce if wall_bounce is not None else PUCK_WALL_BOUNCE
+        # Main body, outline and inner circle for depth
+        self._sprite, self._sprite_offset = circle_sprite([
+            (self.color, self.radius, 0),
+            (WHITE, self.radius, 2),
+            ((255, 240, 150), self.radius - 5, 1),
+        ])
     
     def update(self):
         """Update puck position based on velocity. Returns 'left', 'right', or None for goal detection"""
-        # Apply friction
-        self.vel_x *= self.friction
-        self.vel_y *= self.friction
-        
-        # Update position
-        self.x += self.vel_x
-        self.y += self.vel_y
-        
-        # Check for goals first
-        # Left goal (player 2 scores)
-        if self.x - self.radius < GOAL_WIDTH and GOAL_Y < self.y < GOAL_Y + GOAL_HEIGHT:
-            return 'left'
-        
-        # Right goal (player 1 scores)
-        if self.x + self.radius > SCREEN_WIDTH - GOAL_WIDTH and GOAL_Y < self.y < GOAL_Y + GOAL_HEIGHT:
-            return 'right'
+        # Apply friction, working on locals
+        vel_x = self.vel_x * self.friction
+        vel_y = self.vel_y * self.friction
+        x = self.x
+        y = self.y
+        radius = self.radius
+        bounce = self.wall_bounce
         
-        # Wall collision detection and bouncing (excluding goal areas)
-        # Left wall (not in goal)
-        if self.x - self.radius < 0:
-            if not (GOAL_Y < self.y < GOAL_Y + GOAL_HEIGHT):
-                self.x = self.radius
-                self.vel_x = abs(self.vel_x) * self.wall_bounce
+        # A collision can push the puck past a wall whatever way it is moving; put it back
+        # on the wall first (side walls only outside the goal mouths), and the sweep below
+        # then reflects it if it is still heading out
+        if y < radius:
+            y = radius
+        elif y > SCREEN_HEIGHT - radius:
+            y = SCREEN_HEIGHT - radius
+        if not GOAL_Y < y < GOAL_BOTTOM:
+            if x < radius:
+                x = radius
+            elif x > SCREEN_WIDTH - radius:
+                x = SCREEN_WIDTH - radius
         
-        # Right wall (not in goal)
-        if self.x + self.radius > SCREEN_WIDTH:
-            if not (GOAL_Y < self.y < GOAL_Y + GOAL_HEIGHT):
-                self.x = SCREEN_WIDTH - self.radius
-                self.vel_x = -abs(self.vel_x) * self.wall_bounce
+        # A puck covering more than its radius in a frame moves in radius-sized steps,
+        # so it can't jump past a goal mouth between checks
+        speed_sq = vel_x * vel_x + vel_y * vel_y
+        steps = int(math.sqrt(speed_sq) / radius) + 1 if speed_sq > radius * radius else 1
+        step = 1.0 / steps
         
-        # Top and bottom walls
-        if self.y - self.radius < 0:
-            self.y = self.radius
-            self.vel_y = abs(self.vel_y) * self.wall_bounce
-        elif self.y + self.radius > SCREEN_HEIGHT:
-            self.y = SCREEN_HEIGHT - self.radius
-            self.vel_y = -abs(self.vel_y) * self.wall_bounce
+        for _ in range(steps):
+            # Swept walls: advance to the first wall the puck's edge reaches, reflect,
+            # and spend the rest of the step moving away from it (no tunnelling, no lost travel)
+            remaining = step
+            while True:
+                t_x = t_y = math.inf
+                if vel_x < 0.0:
+                    t_x = (radius - x) / vel_x
+                elif vel_x > 0.0:
+                    t_x = (SCREEN_WIDTH - radius - x) / vel_x
+                if vel_y < 0.0:
+                    t_y = (radius - y) / vel_y
+                elif vel_y > 0.0:
+                    t_y = (SCREEN_HEIGHT - radius - y) / vel_y
+                t_hit = min(t_x, t_y)
+                if t_hit >= remaining:
+                    x += vel_x * remaining
+                    y += vel_y * remaining
+                    break
+                
+                # Starting on (or, by rounding, just past) a wall counts as touching it now
+                t_hit = max(t_hit, 0.0)
+                x += vel_x * t_hit
+                y += vel_y * t_hit
+                remaining -= t_hit
+                
+                if t_y <= t_x:
+                    # Top and bottom walls
+                    y = radius if vel_y < 0.0 else SCREEN_HEIGHT - radius
+                    vel_y = -vel_y * bounce
+                else:
+                    # Left and right walls; level with the goal mouths they are open,
+                    # and reaching one means the goal line is already crossed
+                    if GOAL_Y < y < GOAL_BOTTOM:
+                        self.x, self.y, self.vel_x, self.vel_y = x, y, vel_x, vel_y
+                        return 'left' if vel_x < 0.0 else 'right'
+                    x = radius if vel_x < 0.0 else SCREEN_WIDTH - radius
+                    vel_x = -vel_x * bounce
+            
+            # Goals
+            if GOAL_Y < y < GOAL_BOTTOM:
+                # Left goal (player 2 scores)
+                if x - radius < GOAL_WIDTH:
+                    self.x, self.y, self.vel_x, self.vel_y = x, y, vel_x, vel_y
+                    return 'left'
+                # Right goal (player 1 scores)
+                if x + radius > SCREEN_WIDTH - GOAL_WIDTH:
+                    self.x, self.y, self.vel_x, self.vel_y = x, y, vel_x, vel_y
+                    return 'right'
         
+        self.x, self.y, self.vel_x, self.vel_y = x, y, vel_x, vel_y
         return None
     
     def reset(self):
@@ -168,10 +267,6 @@ class Puck:
     
     def draw(self, screen):
         """Draw the puck on the screen"""
-        # Draw main puck body
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
-        # Draw outline
-        pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y)), self.radius, 2)
-        # Draw inner circle for depth
-        pygame.draw.circle(screen, (255, 240, 150), (int(self.x), int(self.y)), self.radius - 5, 1)
+        offset = self._sprite_offset
+        screen.blit(self._sprite, (int(self.x) - offset, int(self.y) - offset))
 
@@ -3,157 +3,216 @@ Menu screens for the game.
 """
 
 import pygame
-from enum import Enum
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import fields
+from enum import IntEnum
 from typing import Optional, Callable
-from .ui import Button, Slider, TextInput, Label
+from .ui import Button, Slider, TextInput, Label, display_ready, get_font, render_cached
 from .config import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, WHITE, GRAY
 from .config_manager import ConfigManager, GameConfig, PlayerConfig
 
 
-class MenuState(Enum):
+class MenuState(IntEnum):
     """Menu state transitions"""
-    START = "start"
-    PAUSE = "pause"
-    OPTIONS = "options"
-    GAME = "game"
-    SERVER_SELECT = "server_select"
-    MULTIPLAYER = "multiplayer"
-    CREATE_ROOM = "create_room"
-    JOIN_ROOM = "join_room"
-    EXIT = "exit"
+    START = 0
+    PAUSE = 1
+    OPTIONS = 2
+    GAME = 3
+    SERVER_SELECT = 4
+    MULTIPLAYER = 5
+    CREATE_ROOM = 6
+    JOIN_ROOM = 7
+    EXIT = 8
 
 
-class StartMenu:
+class _ColorChannelSetter:
+    """Slider callback that writes one RGB channel of a config color attribute"""
+    
+    __slots__ = ('cfg', 'attr', 'ch')
+    
+    def __init__(self, cfg, attr, ch):
+        self.cfg = cfg
+        self.attr = attr
+        self.ch = ch
+    
+    def __call__(self, value):
+        # Read the current color each time so edits to other channels are kept
+        color = list(getattr(self.cfg, self.attr))
+        color[self.ch] = int(value)
+        setattr(self.cfg, self.attr, tuple(color))
+
+
+def _build_button_column(specs, x, y0, dy=80, w=300, h=60):
+    """Build a vertical column of buttons centered on x from (text, callback) pairs"""
+    return [Button(x - w // 2, y0 + i * dy, w, h, text, callback=callback)
+            for i, (text, callback) in enumerate(specs)]
+
+
+class _Menu:
+    """Full-screen menu that only redraws after its contents change"""
+    
+    __slots__ = ('_dirty', '_dirty_buttons')
+    
+    def invalidate(self):
+        """Force a full redraw on the next draw() call"""
+        self._dirty = True
+    
+    def _queue_buttons(self, event):
+        """Pass event to the buttons, remembering those whose appearance changed"""
+        for button in self.buttons:
+            if button.handle_event(event):
+                self._dirty_buttons.append(button)
+    
+    def draw(self):
+        """
+        Redraw whatever changed since the last call.
+        Returns the screen rects that changed, for pygame.display.update
+        """
+        if self._dirty:
+            self._dirty = False
+            self._dirty_buttons.clear()
+            self._redraw()
+            return [self.screen.get_rect()]
+        
+        # Only hovered/clicked buttons changed; their surfaces are opaque and cover their rects
+        changed = self._dirty_buttons
+        if not changed:
+            return []
+        self._dirty_buttons = []
+        self.screen.blits([button.blit_args() for button in changed], doreturn=False)
+        return [button.rect for button in changed]
+
+
+class StartMenu(_Menu):
     """Main start menu"""
     
+    __slots__ = ('screen', 'on_start', 'on_options', 'on_exit', 'on_multiplayer', 'buttons',
+                 'title_font', '_title_surf', '_title_rect')
+    
     def __init__(self, screen, on_start: Callable, on_options: Callable, on_exit: Callable, 
                  on_multiplayer: Optional[Callable] = None):
         self.screen = screen
+        self._dirty = True
+        self._dirty_buttons = []
         self.on_start = on_start
         self.on_options = on_options
         self.on_exit = on_exit
         self.on_multiplayer = on_multiplayer
         
-        center_x = SCREEN_WIDTH // 2
-        button_width = 300
-        button_height = 60
-        button_y_start = SCREEN_HEIGHT // 2 - 50
-        
-        self.start_button = Button(
-            center_x - button_width // 2, button_y_start,
-            button_width, button_height, "Start Game",
-            callback=lambda: self.on_start()
-        )
-        
-        self.multiplayer_button = Button(
-            center_x - button_width // 2, button_y_start + 80,
-            button_width, button_height, "Multiplayer",
-            callback=lambda: self.on_multiplayer() if hasattr(self, 'on_multiplayer') else None
-        )
-        
-        self.options_button = Button(
-            center_x - button_width // 2, button_y_start + 160,
-            button_width, button_height, "Options",
-            callback=lambda: self.on_options()
-        )
-        
-        self.exit_button = Button(
-            center_x - button_width // 2, button_y_start + 240,
-            button_width, button_height, "Exit",
-            callback=lambda: self.on_exit()
-        )
+        # The multiplayer entry only exists when a handler was supplied
+        specs = [("Start Game", on_start)]
+        if on_multiplayer is not None:
+            specs.append(("Multiplayer", on_multiplayer))
+        specs += [("Options", on_options), ("Exit", on_exit)]
+        self.buttons = _build_button_column(specs, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50)
         
-        self.title_font = pygame.font.Font(None, 96)
+        self.title_font = get_font(96)
+        self._title_surf = display_ready(self.title_font.render("Chain Hockey", True, WHITE))
+        self._title_rect = self._title_surf.get_rect(center=(SCREEN_WIDTH // 2, 150))
     
     def handle_event(self, event):
         """Handle events"""
-        self.start_button.handle_event(event)
-        if self.multiplayer_button:
-            self.multiplayer_button.handle_event(event)
-        self.options_button.handle_event(event)
-        self.exit_button.handle_event(event)
+        self._queue_buttons(event)
     
-    def draw(self):
+    def _redraw(self):
         """Draw the menu"""
         self.screen.fill(BLACK)
         
-        # Draw title
-        title_text = self.title_font.render("Chain Hockey", True, WHITE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 150))
-        self.screen.blit(title_text, title_rect)
-        
-        # Draw buttons
-        self.start_button.draw(self.screen)
-        if self.multiplayer_button:
-            self.multiplayer_button.draw(self.screen)
-        self.options_button.draw(self.screen)
-        self.exit_button.draw(self.screen)
+        # Draw title and buttons in one batch
+        self.screen.blits([(self._title_surf, self._title_rect)]
+                          + [button.blit_args() for button in self.buttons], doreturn=False)
 
 
-class PauseMenu:
+class PauseMenu(_Menu):
     """Pause menu"""
     
+    __slots__ = ('screen', 'on_resume', 'on_options', 'on_main_menu', 'buttons', 'title_font',
+                 '_title_surf', '_title_rect', '_backbuffer', '_stale', '_dirty_rects')
+    
     def __init__(self, screen, on_resume: Callable, on_options: Callable, on_main_menu: Callable):
         self.screen = screen
         self.on_resume = on_resume
         self.on_options = on_options
         self.on_main_menu = on_main_menu
         
-        center_x = SCREEN_WIDTH // 2
-        button_width = 300
-        button_height = 60
-        button_y_start = SCREEN_HEIGHT // 2 - 50
-        
-        self.resume_button = Button(
-            center_x - button_width // 2, button_y_start,
-            button_width, button_height, "Resume",
-            callback=lambda: self.on_resume()
-        )
-        
-        self.options_button = Button(
-            center_x - button_width // 2, button_y_start + 80,
-            button_width, button_height, "Options",
-            callback=lambda: self.on_options()
-        )
+        self.buttons = _build_button_column([
+            ("Resume", on_resume),
+            ("Options", on_options),
+            ("Main Menu", on_main_menu),
+        ], SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50)
         
-        self.main_menu_button = Button(
-            center_x - button_width // 2, button_y_start + 160,
-            button_width, button_height, "Main Menu",
-            callback=lambda: self.on_main_menu()
-        )
+        self.title_font = get_font(72)
+        self._title_surf = display_ready(self.title_font.render("PAUSED", True, WHITE))
+        self._title_rect = self._title_surf.get_rect(center=(SCREEN_WIDTH // 2, 150))
         
-        self.title_font = pygame.font.Font(None, 72)
+        # Overlay, title and buttons composed into one translucent surface,
+        # rebuilt only when a button's appearance changes
+        self._backbuffer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self._stale = True
+        # Screen areas to repaint on the next draw; _dirty means the whole screen
+        self._dirty = True
+        self._dirty_rects = []
     
     def handle_event(self, event):
         """Handle events"""
-        self.resume_button.handle_event(event)
-        self.options_button.handle_event(event)
-        self.main_menu_button.handle_event(event)
-    
-    def draw(self, game_screen):
-        """Draw pause menu overlay"""
-        # Draw semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
-        # Draw title
-        title_text = self.title_font.render("PAUSED", True, WHITE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 150))
-        self.screen.blit(title_text, title_rect)
-        
-        # Draw buttons
-        self.resume_button.draw(self.screen)
-        self.options_button.draw(self.screen)
-        self.main_menu_button.draw(self.screen)
+        for button in self.buttons:
+            if button.handle_event(event):
+                self._stale = True
+                self._dirty_rects.append(button.rect)
+    
+    def _render_backbuffer(self):
+        """Compose the semi-transparent overlay, title and buttons"""
+        self._backbuffer.fill((*BLACK, 200))
+        self._backbuffer.blits([(self._title_surf, self._title_rect)]
+                               + [button.blit_args() for button in self.buttons], doreturn=False)
+        self._stale = False
+    
+    def draw(self, game_screen, background=None):
+        """
+        Draw the pause overlay over background (the frozen game frame).
+        Returns the screen rects that changed, for pygame.display.update
+        """
+        if self._stale:
+            self._render_backbuffer()
+        
+        if self._dirty or background is None:
+            self._dirty = False
+            self._dirty_rects.clear()
+            if background is not None:
+                self.screen.blit(background, (0, 0))
+            self.screen.blit(self._backbuffer, (0, 0))
+            return [self.screen.get_rect()]
+        
+        # Only hovered/clicked buttons changed: restore and re-overlay just those areas
+        dirty = self._dirty_rects
+        self._dirty_rects = []
+        for rect in dirty:
+            self.screen.blit(background, rect, rect)
+            self.screen.blit(self._backbuffer, rect, rect)
+        return dirty
 
 
-class OptionsMenu:
+class OptionsMenu(_Menu):
     """Options menu with configuration controls"""
     
+    __slots__ = ('screen', 'config_manager', 'on_back', 'config', 'scroll_offset',
+                 'scroll_speed', 'buttons', 'sliders', 'text_inputs', '_slider_sources',
+                 '_label_surfs', '_label_xs', '_label_ys', '_scroll_hint_surf', '_slider_ys',
+                 '_text_input_ys', '_widget_buckets', '_active_slider', '_focused_input')
+    
+    # Height of the y-buckets used to find the widget under the mouse
+    _BUCKET_HEIGHT = 32
+    
+    # Event types each kind of widget reacts to; anything else stops after scrolling
+    _BUTTON_EVENTS = frozenset((pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN))
+    _WIDGET_EVENTS = frozenset((pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                                pygame.KEYDOWN))
+    
     def __init__(self, screen, config_manager: ConfigManager, on_back: Callable):
         self.screen = screen
+        self._dirty = True
+        self._dirty_buttons = []
         self.config_manager = config_manager
         self.on_back = on_back
         self.config = config_manager.get_config()
@@ -166,7 +225,16 @@ class OptionsMenu:
         self.buttons = []
         self.sliders = []
         self.text_inputs = []
-        self.labels = []
+        self._slider_sources = []  # (slider, target, attr, channel) for refreshing values
+        
+        # Labels are static, so only their rendered surfaces and positions are
+        # kept, as parallel arrays (sorted by y after _create_ui)
+        self._label_surfs = []
+        self._label_xs = array('i')
+        self._label_ys = array('i')
+        
+        self._scroll_hint_surf = render_cached(
+            get_font(24), "Use Mouse Wheel, UP/DOWN, or W/S to scroll", GRAY)
         
         self._create_ui()
     
@@ -199,8 +267,7 @@ class OptionsMenu:
         self.buttons.append(reset_button)
         
         # Title
-        title = Label(SCREEN_WIDTH // 2 - 150, 20, "OPTIONS", 72, WHITE)
-        self.labels.append(title)
+        self._add_label(SCREEN_WIDTH // 2 - 150, 20, "OPTIONS", 72, WHITE)
         
         # Player 1 section
         self._create_player_section(1, 50, 100)
@@ -211,100 +278,129 @@ class OptionsMenu:
         # Calculate where global section should be (after both player sections)
         # Player sections go down to about y=600, so start global at 650
         self._create_global_section()
+        
+        self._index_widgets()
+    
+    def _index_widgets(self):
+        """Sort scrolled widgets by y so draw() can bisect the visible slice"""
+        order = sorted(range(len(self._label_ys)), key=self._label_ys.__getitem__)
+        self._label_surfs = [self._label_surfs[i] for i in order]
+        self._label_xs = array('i', (self._label_xs[i] for i in order))
+        self._label_ys = array('i', (self._label_ys[i] for i in order))
+        self.sliders.sort(key=lambda slider: slider.rect.y)
+        self.text_inputs.sort(key=lambda text_input: text_input.rect.y)
+        self._slider_ys = [slider.rect.y for slider in self.sliders]
+        self._text_input_ys = [text_input.rect.y for text_input in self.text_inputs]
+        
+        # Bucket interactive widgets by content-space y for O(1) hit testing
+        widgets = self.sliders + self.text_inputs
+        bottom = max((widget.rect.bottom for widget in widgets), default=0)
+        self._widget_buckets = [[] for _ in range(bottom // self._BUCKET_HEIGHT + 1)]
+        for widget in widgets:
+            first = widget.rect.top // self._BUCKET_HEIGHT
+            last = (widget.rect.bottom - 1) // self._BUCKET_HEIGHT
+            for bucket in range(max(0, first), last + 1):
+                self._widget_buckets[bucket].append(widget)
+        self._active_slider = None
+        self._focused_input = None
+    
+    def _widget_at(self, pos):
+        """Return the slider or text input under a content-space point, if any"""
+        bucket = pos[1] // self._BUCKET_HEIGHT
+        if 0 <= bucket < len(self._widget_buckets):
+            for widget in self._widget_buckets[bucket]:
+                if widget.rect.collidepoint(pos):
+                    return widget
+        return None
+    
+    @staticmethod
+    def _visible_range(ys, offset):
+        """Index range of sorted ys that lie on screen for the given scroll offset"""
+        return bisect_left(ys, offset), bisect_right(ys, offset + SCREEN_HEIGHT)
     
     def _create_player_section(self, player_num, x, y):
         """Create UI for a player's configuration"""
         player_config = self.config.player1 if player_num == 1 else self.config.player2
         player_name = f"Player {player_num}"
         
-        # Apply scroll offset
-        y = y - self.scroll_offset
-        
         # Player title
-        title = Label(x, y, player_name, 36, WHITE)
-        self.labels.append(title)
+        self._add_label(x, y, player_name, 36, WHITE)
         
         y_offset = y + 50
         
         # Striker section
-        striker_label = Label(x, y_offset - self.scroll_offset, "Striker", 28, GRAY)
-        self.labels.append(striker_label)
+        self._add_label(x, y_offset, "Striker", 28, GRAY)
         y_offset += 50  # More space between label and first control
         
         # Striker radius
-        self._add_slider(x, y_offset, 200, 5, 50, player_config.striker_radius, 1.0,
-                        "Radius", lambda v: setattr(player_config, 'striker_radius', v))
+        self._add_slider(x, y_offset, 200, 5, 50, player_config, 'striker_radius', 1.0,
+                        "Radius")
         y_offset += 50
         
         # Striker mass
-        self._add_slider(x, y_offset, 200, 1, 20, player_config.striker_mass, 0.5,
-                        "Mass", lambda v: setattr(player_config, 'striker_mass', v))
+        self._add_slider(x, y_offset, 200, 1, 20, player_config, 'striker_mass', 0.5,
+                        "Mass")
         y_offset += 50
         
         # Striker speed
-        self._add_slider(x, y_offset, 200, 1, 15, player_config.striker_speed, 0.5,
-                        "Speed", lambda v: setattr(player_config, 'striker_speed', v))
+        self._add_slider(x, y_offset, 200, 1, 15, player_config, 'striker_speed', 0.5,
+                        "Speed")
         y_offset += 50
         
         # Striker color RGB
-        color_label = Label(x, y_offset - self.scroll_offset, "Color (RGB):", 24, WHITE)
-        self.labels.append(color_label)
+        self._add_label(x, y_offset, "Color (RGB):", 24, WHITE)
         y_offset += 40  # More space between label and sliders
         
         self._add_color_sliders(x, y_offset, player_config, 'striker_color')
         y_offset += 100
         
         # Chain section
-        chain_label = Label(x, y_offset - self.scroll_offset, "Chain", 28, GRAY)
-        self.labels.append(chain_label)
+        self._add_label(x, y_offset, "Chain", 28, GRAY)
         y_offset += 50  # More space between label and first control
         
         # Chain segments
-        self._add_slider(x, y_offset, 200, 3, 30, player_config.chain_segments, 1,
-                        "Segments", lambda v: setattr(player_config, 'chain_segments', int(v)))
+        self._add_slider(x, y_offset, 200, 3, 30, player_config, 'chain_segments', 1,
+                        "Segments", int)
         y_offset += 50
         
         # Segment length
-        self._add_slider(x, y_offset, 200, 5, 30, player_config.segment_length, 1.0,
-                        "Length", lambda v: setattr(player_config, 'segment_length', v))
+        self._add_slider(x, y_offset, 200, 5, 30, player_config, 'segment_length', 1.0,
+                        "Length")
         y_offset += 50
         
         # Chain thickness
-        self._add_slider(x, y_offset, 200, 1, 10, player_config.chain_thickness, 1,
-                        "Thickness", lambda v: setattr(player_config, 'chain_thickness', int(v)))
+        self._add_slider(x, y_offset, 200, 1, 10, player_config, 'chain_thickness', 1,
+                        "Thickness", int)
         y_offset += 50
         
         # Chain damping
-        self._add_slider(x, y_offset, 200, 0.5, 1.0, player_config.chain_damping, 0.01,
-                        "Damping", lambda v: setattr(player_config, 'chain_damping', v))
+        self._add_slider(x, y_offset, 200, 0.5, 1.0, player_config, 'chain_damping', 0.01,
+                        "Damping")
         y_offset += 50
         
         # Chain color RGB
-        color_label = Label(x, y_offset - self.scroll_offset, "Color (RGB):", 24, WHITE)
-        self.labels.append(color_label)
+        self._add_label(x, y_offset, "Color (RGB):", 24, WHITE)
         y_offset += 40  # More space between label and sliders
         
         self._add_color_sliders(x, y_offset, player_config, 'chain_color')
         y_offset += 100
         
         # Hammer section
-        hammer_label = Label(x, y_offset - self.scroll_offset, "Hammer", 28, GRAY)
-        self.labels.append(hammer_label)
+        self._add_label(x, y_offset, "Hammer", 28, GRAY)
         y_offset += 50  # More space between label and first control
         
         # Hammer radius
-        self._add_slider(x, y_offset, 200, 10, 60, player_config.hammer_radius, 1.0,
-                        "Radius", lambda v: setattr(player_config, 'hammer_radius', v))
+        self._add_slider(x, y_offset, 200, 10, 60, player_config, 'hammer_radius', 1.0,
+                        "Radius")
         y_offset += 50
         
         # Hammer mass
-        self._add_slider(x, y_offset, 200, 1, 30, player_config.hammer_mass, 0.5,
-                        "Mass", lambda v: setattr(player_config, 'hammer_mass', v))
+        self._add_slider(x, y_offset, 200, 1, 30, player_config, 'hammer_mass', 0.5,
+                        "Mass")
         y_offset += 50
         
         # Hammer color RGB
-        color_label = Label(x, y_offset - self.scroll_offset, "Color (RGB):", 24, WHITE)
-        self.labels.append(color_label)
+        self._add_label(x, y_offset, "Color (RGB):", 24, WHITE)
         y_offset += 40  # More space between label and sliders
         
         self._add_color_sliders(x, y_offset, player_config, 'hammer_color')
@@ -314,72 +410,75 @@ class OptionsMenu:
         # Position global section at the bottom, after both player sections
         # Each player section is about 600 pixels tall, so start global at 650
         x = SCREEN_WIDTH // 2 - 150
-        y = 650 - self.scroll_offset
+        y = 650
         
-        global_label = Label(x, y, "Global Physics", 28, GRAY)
-        self.labels.append(global_label)
+        self._add_label(x, y, "Global Physics", 28, GRAY)
         y += 50  # More space between label and first control
         
         # Gravity
-        self._add_slider(x, y, 300, -1.0, 1.0, self.config.gravity, 0.01,
-                        "Gravity", lambda v: setattr(self.config, 'gravity', v))
+        self._add_slider(x, y, 300, -1.0, 1.0, self.config, 'gravity', 0.01,
+                        "Gravity")
         y += 50
         
         # Constraint iterations
-        self._add_slider(x, y, 300, 5, 30, self.config.constraint_iterations, 1,
-                        "Constraint Iterations", lambda v: setattr(self.config, 'constraint_iterations', int(v)))
+        self._add_slider(x, y, 300, 5, 30, self.config, 'constraint_iterations', 1,
+                        "Constraint Iterations", int)
         y += 50
         
         # Puck friction
-        self._add_slider(x, y, 300, 0.9, 1.0, self.config.puck_friction, 0.001,
-                        "Puck Friction", lambda v: setattr(self.config, 'puck_friction', v))
+        self._add_slider(x, y, 300, 0.9, 1.0, self.config, 'puck_friction', 0.001,
+                        "Puck Friction")
         y += 50
         
         # Puck wall bounce
-        self._add_slider(x, y, 300, 0.5, 1.0, self.config.puck_wall_bounce, 0.01,
-                        "Puck Wall Bounce", lambda v: setattr(self.config, 'puck_wall_bounce', v))
+        self._add_slider(x, y, 300, 0.5, 1.0, self.config, 'puck_wall_bounce', 0.01,
+                        "Puck Wall Bounce")
         y += 50
         
         # Game duration
-        self._add_slider(x, y, 300, 60, 600, self.config.game_duration_seconds, 30,
-                        "Game Duration (sec)", lambda v: setattr(self.config, 'game_duration_seconds', int(v)))
+        self._add_slider(x, y, 300, 60, 600, self.config, 'game_duration_seconds', 30,
+                        "Game Duration (sec)", int)
         y += 50
         
         # Max goals
-        self._add_slider(x, y, 300, 1, 20, self.config.max_goals, 1,
-                        "Max Goals", lambda v: setattr(self.config, 'max_goals', int(v)))
-    
-    def _add_slider(self, x, y, width, min_val, max_val, initial_val, step, label, callback):
-        """Add a slider to the UI"""
-        # Apply scroll offset
-        y = y - self.scroll_offset
-        slider = Slider(x, y, width, min_val, max_val, initial_val, step, label, callback)
+        self._add_slider(x, y, 300, 1, 20, self.config, 'max_goals', 1,
+                        "Max Goals", int)
+    
+    def _add_label(self, x, y, text, font_size, color):
+        """Add a static label to the UI"""
+        label = Label(x, y, text, font_size, color)
+        self._label_surfs.append(label._surf)
+        self._label_xs.append(x)
+        self._label_ys.append(y)
+    
+    def _add_slider(self, x, y, width, min_val, max_val, target, attr, step, label, cast=None):
+        """Add a slider bound to target.attr (optionally converting values with cast)"""
+        callback = (lambda v: setattr(target, attr, cast(v))) if cast else (lambda v: setattr(target, attr, v))
+        slider = Slider(x, y, width, min_val, max_val, getattr(target, attr), step, label, callback)
         self.sliders.append(slider)
+        self._slider_sources.append((slider, target, attr, None))
     
     def _add_color_sliders(self, x, y, player_config, color_attr):
         """Add RGB color sliders"""
         current_color = getattr(player_config, color_attr)
         
-        # Apply scroll offset
-        y = y - self.scroll_offset
-        
         # R slider
         r_slider = Slider(x, y, 200, 0, 255, current_color[0], 1, "R",
-                         lambda v: setattr(player_config, color_attr, 
-                                          (int(v), current_color[1], current_color[2])))
+                         _ColorChannelSetter(player_config, color_attr, 0))
         self.sliders.append(r_slider)
+        self._slider_sources.append((r_slider, player_config, color_attr, 0))
         
         # G slider
         g_slider = Slider(x, y + 30, 200, 0, 255, current_color[1], 1, "G",
-                         lambda v: setattr(player_config, color_attr,
-                                          (current_color[0], int(v), current_color[2])))
+                         _ColorChannelSetter(player_config, color_attr, 1))
         self.sliders.append(g_slider)
+        self._slider_sources.append((g_slider, player_config, color_attr, 1))
         
         # B slider
         b_slider = Slider(x, y + 60, 200, 0, 255, current_color[2], 1, "B",
-                         lambda v: setattr(player_config, color_attr,
-                                          (current_color[0], current_color[1], int(v))))
+                         _ColorChannelSetter(player_config, color_attr, 2))
         self.sliders.append(b_slider)
+        self._slider_sources.append((b_slider, player_config, color_attr, 2))
     
     def _save_config(self):
         """Save current configuration"""
@@ -389,101 +488,135 @@ class OptionsMenu:
     def _load_config(self):
         """Load configuration from file"""
         self.config_manager.load()
-        self.config = self.config_manager.get_config()
-        # Recreate UI with new config values
-        self.buttons.clear()
-        self.sliders.clear()
-        self.text_inputs.clear()
-        self.labels.clear()
-        self._create_ui()
+        self._apply_config(self.config_manager.get_config())
     
     def _reset_defaults(self):
         """Reset to default configuration"""
-        self.config = GameConfig.default()
+        self._apply_config(GameConfig.default())
+    
+    def _apply_config(self, new_config: GameConfig):
+        """
+        Copy new_config's values into the config objects the sliders are bound
+        to and move the sliders to match, instead of rebuilding the UI.
+        """
+        for f in fields(GameConfig):
+            value = getattr(new_config, f.name)
+            if isinstance(value, PlayerConfig):
+                vars(getattr(self.config, f.name)).update(vars(value))
+            else:
+                setattr(self.config, f.name, value)
         self.config_manager.set_config(self.config)
-        # Recreate UI with default values
-        self.buttons.clear()
-        self.sliders.clear()
-        self.text_inputs.clear()
-        self.labels.clear()
-        self._create_ui()
+        
+        for slider, target, attr, channel in self._slider_sources:
+            value = getattr(target, attr)
+            slider.set_value(value if channel is None else value[channel])
+        self._dirty = True
     
     def handle_event(self, event):
         """Handle events"""
-        # Handle scrolling
+        # Handle scrolling (widgets keep their layout; only the view offset moves)
+        old_offset = self.scroll_offset
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP or event.key == pygame.K_w:
                 self.scroll_offset = max(0, self.scroll_offset - self.scroll_speed)
-                # Recreate UI with new scroll offset
-                self.buttons.clear()
-                self.sliders.clear()
-                self.text_inputs.clear()
-                self.labels.clear()
-                self._create_ui()
             elif event.key == pygame.K_DOWN or event.key == pygame.K_s:
                 self.scroll_offset += self.scroll_speed
-                # Recreate UI with new scroll offset
-                self.buttons.clear()
-                self.sliders.clear()
-                self.text_inputs.clear()
-                self.labels.clear()
-                self._create_ui()
         elif event.type == pygame.MOUSEWHEEL:
             self.scroll_offset = max(0, self.scroll_offset - event.y * self.scroll_speed)
-            # Recreate UI with new scroll offset
-            self.buttons.clear()
-            self.sliders.clear()
-            self.text_inputs.clear()
-            self.labels.clear()
-            self._create_ui()
-        
-        for button in self.buttons:
-            button.handle_event(event)
-        for slider in self.sliders:
-            slider.handle_event(event)
-        for text_input in self.text_inputs:
-            text_input.handle_event(event)
-    
-    def draw(self):
+        changed = self.scroll_offset != old_offset
+        
+        # Fast exit for events no widget consumes (wheel, key presses with nothing focused, ...)
+        if event.type not in self._WIDGET_EVENTS or (
+                event.type == pygame.KEYDOWN and self._focused_input is None):
+            if changed:
+                self._dirty = True
+            return
+        
+        # Buttons are fixed to the screen and checked for mouse events
+        if event.type in self._BUTTON_EVENTS:
+            for button in self.buttons:
+                changed |= button.handle_event(event)
+        
+        # Scrolled widgets: dispatch only to the one that can react
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            event = self._to_content_coords(event)
+            hit = self._widget_at(event.pos)
+            if self._focused_input is not None and self._focused_input is not hit:
+                changed |= self._focused_input.handle_event(event)  # Click elsewhere drops focus
+                self._focused_input = None
+            if hit is not None:
+                changed |= hit.handle_event(event)
+                if getattr(hit, 'dragging', False):
+                    self._active_slider = hit
+                elif getattr(hit, 'active', False):
+                    self._focused_input = hit
+        elif event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP):
+            if self._active_slider is not None:
+                changed |= self._active_slider.handle_event(self._to_content_coords(event))
+                if not self._active_slider.dragging:
+                    self._active_slider = None
+        elif event.type == pygame.KEYDOWN:
+            if self._focused_input is not None:
+                changed |= self._focused_input.handle_event(event)
+                if not self._focused_input.active:
+                    self._focused_input = None
+        
+        if changed:
+            self._dirty = True
+    
+    def _to_content_coords(self, event):
+        """Translate a mouse event from screen space into scrolled content space"""
+        if not self.scroll_offset or not hasattr(event, 'pos'):
+            return event
+        attrs = dict(event.dict)
+        attrs['pos'] = (event.pos[0], event.pos[1] + self.scroll_offset)
+        return pygame.event.Event(event.type, attrs)
+    
+    def _redraw(self):
         """Draw the options menu"""
         self.screen.fill(BLACK)
         
         # Draw scroll instructions
-        font = pygame.font.Font(None, 24)
-        scroll_text = font.render("Use Mouse Wheel, UP/DOWN, or W/S to scroll", True, GRAY)
-        self.screen.blit(scroll_text, (SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT - 30))
+        self.screen.blit(self._scroll_hint_surf, (SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT - 30))
+        
+        offset = self.scroll_offset
         
         # Draw labels (only if visible on screen)
-        for label in self.labels:
-            if 0 <= label.y <= SCREEN_HEIGHT:
-                label.draw(self.screen)
+        lo, hi = self._visible_range(self._label_ys, offset)
+        self.screen.blits([
+            (surf, (x, y - offset))
+            for surf, x, y in zip(self._label_surfs[lo:hi], self._label_xs[lo:hi], self._label_ys[lo:hi])
+        ], doreturn=False)
         
         # Draw buttons (always visible at bottom)
-        for button in self.buttons:
-            button.draw(self.screen)
+        self.screen.blits([button.blit_args() for button in self.buttons], doreturn=False)
         
         # Draw sliders (only if visible on screen)
-        for slider in self.sliders:
-            if 0 <= slider.rect.y <= SCREEN_HEIGHT:
-                slider.draw(self.screen)
+        lo, hi = self._visible_range(self._slider_ys, offset)
+        for slider in self.sliders[lo:hi]:
+            slider.draw(self.screen, offset)
         
         # Draw text inputs (only if visible on screen)
-        for text_input in self.text_inputs:
-            if 0 <= text_input.rect.y <= SCREEN_HEIGHT:
-                text_input.draw(self.screen)
+        lo, hi = self._visible_range(self._text_input_ys, offset)
+        for text_input in self.text_inputs[lo:hi]:
+            text_input.draw(self.screen, offset)
 
 
-class ServerSelectionMenu:
+class ServerSelectionMenu(_Menu):
     """Menu for selecting server IP"""
     
+    __slots__ = ('screen', 'on_connect', 'on_back', 'server_input', 'buttons',
+                 'title_font', '_title_surf', '_title_rect', 'label_font',
+                 '_label_surf', '_label_rect', 'error_message', '_error_blit')
+    
     def __init__(self, screen, on_connect: Callable, on_back: Callable):
         self.screen = screen
+        self._dirty = True
+        self._dirty_buttons = []
         self.on_connect = on_connect
         self.on_back = on_back
         
         center_x = SCREEN_WIDTH // 2
-        button_width = 200
-        button_height = 60
         
         # Server IP input
         self.server_input = TextInput(
@@ -491,21 +624,19 @@ class ServerSelectionMenu:
             300, 50, initial_value="192.168.1.100"  # Example IP
         )
         
-        self.connect_button = Button(
-            center_x - button_width // 2, SCREEN_HEIGHT // 2 + 50,
-            button_width, button_height, "Connect",
-            callback=lambda: self._handle_connect()
-        )
-        
-        self.back_button = Button(
-            center_x - button_width // 2, SCREEN_HEIGHT // 2 + 130,
-            button_width, button_height, "Back",
-            callback=lambda: self.on_back()
-        )
-        
-        self.title_font = pygame.font.Font(None, 72)
-        self.label_font = pygame.font.Font(None, 24)
+        self.buttons = _build_button_column([
+            ("Connect", self._handle_connect),
+            ("Back", on_back),
+        ], center_x, SCREEN_HEIGHT // 2 + 50, w=200)
+        
+        self.title_font = get_font(72)
+        self._title_surf = display_ready(self.title_font.render("Server Selection", True, WHITE))
+        self._title_rect = self._title_surf.get_rect(center=(SCREEN_WIDTH // 2, 150))
+        self.label_font = get_font(24)
+        self._label_surf = display_ready(self.label_font.render("Enter Server IP:", True, WHITE))
+        self._label_rect = self._label_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 80))
         self.error_message = None
+        self._error_blit = None
     
     def _handle_connect(self):
         """Handle connect button click"""
@@ -513,178 +644,170 @@ class ServerSelectionMenu:
         if server_ip:
             self.on_connect(f"ws://{server_ip}:8765")
         else:
-            self.error_message = "Please enter server IP"
+            self.set_error("Please enter server IP")
     
     def set_error(self, message: str):
-        """Set error message"""
+        """Set error message, rendering it once here rather than on every draw"""
+        if message == self.error_message:
+            return
         self.error_message = message
+        self._dirty = True
+        if message:
+            error_text = display_ready(self.label_font.render(message, True, (255, 50, 50)))
+            self._error_blit = (error_text, error_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20)))
+        else:
+            self._error_blit = None
     
     def handle_event(self, event):
         """Handle events"""
-        self.server_input.handle_event(event)
-        self.connect_button.handle_event(event)
-        self.back_button.handle_event(event)
+        if self.server_input.handle_event(event):
+            self._dirty = True
+        self._queue_buttons(event)
     
-    def draw(self):
+    def _redraw(self):
         """Draw the menu"""
         self.screen.fill(BLACK)
         
-        # Draw title
-        title_text = self.title_font.render("Server Selection", True, WHITE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 150))
-        self.screen.blit(title_text, title_rect)
-        
-        # Draw label
-        label_text = self.label_font.render("Enter Server IP:", True, WHITE)
-        label_rect = label_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 80))
-        self.screen.blit(label_text, label_rect)
+        # Draw title, label and buttons in one batch
+        self.screen.blits([(self._title_surf, self._title_rect), (self._label_surf, self._label_rect)]
+                          + [button.blit_args() for button in self.buttons], doreturn=False)
         
         # Draw input
         self.server_input.draw(self.screen)
         
         # Draw error message
-        if self.error_message:
-            error_text = self.label_font.render(self.error_message, True, (255, 50, 50))
-            error_rect = error_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
-            self.screen.blit(error_text, error_rect)
-        
-        # Draw buttons
-        self.connect_button.draw(self.screen)
-        self.back_button.draw(self.screen)
+        if self._error_blit:
+            self.screen.blit(*self._error_blit)
 
 
-class MultiplayerMenu:
+class MultiplayerMenu(_Menu):
     """Multiplayer menu - choose create or join room"""
     
+    __slots__ = ('screen', 'on_create_room', 'on_join_room', 'on_back', 'buttons', 'title_font',
+                 '_title_surf', '_title_rect')
+    
     def __init__(self, screen, on_create_room: Callable, on_join_room: Callable, on_back: Callable):
         self.screen = screen
+        self._dirty = True
+        self._dirty_buttons = []
         self.on_create_room = on_create_room
         self.on_join_room = on_join_room
         self.on_back = on_back
         
-        center_x = SCREEN_WIDTH // 2
-        button_width = 300
-        button_height = 60
-        button_y_start = SCREEN_HEIGHT // 2 - 50
-        
-        self.create_button = Button(
-            center_x - button_width // 2, button_y_start,
-            button_width, button_height, "Create Room",
-            callback=lambda: self.on_create_room()
-        )
-        
-        self.join_button = Button(
-            center_x - button_width // 2, button_y_start + 80,
-            button_width, button_height, "Join Room",
-            callback=lambda: self.on_join_room()
-        )
+        self.buttons = _build_button_column([
+            ("Create Room", on_create_room),
+            ("Join Room", on_join_room),
+            ("Back", on_back),
+        ], SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50)
         
-        self.back_button = Button(
-            center_x - button_width // 2, button_y_start + 160,
-            button_width, button_height, "Back",
-            callback=lambda: self.on_back()
-        )
-        
-        self.title_font = pygame.font.Font(None, 72)
+        self.title_font = get_font(72)
+        self._title_surf = display_ready(self.title_font.render("Multiplayer", True, WHITE))
+        self._title_rect = self._title_surf.get_rect(center=(SCREEN_WIDTH // 2, 150))
     
     def handle_event(self, event):
         """Handle events"""
-        self.create_button.handle_event(event)
-        self.join_button.handle_event(event)
-        self.back_button.handle_event(event)
+        self._queue_buttons(event)
     
-    def draw(self):
+    def _redraw(self):
         """Draw the menu"""
         self.screen.fill(BLACK)
         
-        # Draw title
-        title_text = self.title_font.render("Multiplayer", True, WHITE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 150))
-        self.screen.blit(title_text, title_rect)
-        
-        # Draw buttons
-        self.create_button.draw(self.screen)
-        self.join_button.draw(self.screen)
-        self.back_button.draw(self.screen)
+        # Draw title and buttons in one batch
+        self.screen.blits([(self._title_surf, self._title_rect)]
+                          + [button.blit_args() for button in self.buttons], doreturn=False)
 
 
-class CreateRoomMenu:
+class CreateRoomMenu(_Menu):
     """Menu shown when creating a room - displays room code and waits for player"""
     
+    __slots__ = ('screen', 'room_id', 'on_cancel', 'on_player_joined', 'player_joined',
+                 'buttons', 'title_font', '_title_surf', '_title_rect', 'info_font',
+                 'status_font', '_code_blit', '_waiting_blit', '_joined_blit', '_instructions_blit')
+    
     def __init__(self, screen, room_id: str, on_cancel: Callable, 
                  on_player_joined: Optional[Callable] = None):
         self.screen = screen
+        self._dirty = True
+        self._dirty_buttons = []
         self.room_id = room_id
         self.on_cancel = on_cancel
         self.on_player_joined = on_player_joined
         self.player_joined = False
         
-        center_x = SCREEN_WIDTH // 2
-        button_width = 300
-        button_height = 60
-        
-        self.cancel_button = Button(
-            center_x - button_width // 2, SCREEN_HEIGHT - 100,
-            button_width, button_height, "Cancel",
-            callback=lambda: self.on_cancel()
-        )
-        
-        self.title_font = pygame.font.Font(None, 72)
-        self.info_font = pygame.font.Font(None, 36)
-        self.status_font = pygame.font.Font(None, 24)
+        self.buttons = _build_button_column([
+            ("Cancel", on_cancel),
+        ], SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100)
+        
+        self.title_font = get_font(72)
+        self._title_surf = display_ready(self.title_font.render("Create Room", True, WHITE))
+        self._title_rect = self._title_surf.get_rect(center=(SCREEN_WIDTH // 2, 150))
+        self.info_font = get_font(36)
+        self.status_font = get_font(24)
+        
+        # Everything on this screen is fixed once the room exists, so render it up front
+        self._code_blit = self._centered(self.info_font, f"Room Code: {room_id}", WHITE, 250)
+        self._waiting_blit = self._centered(self.status_font, "Waiting for player 2 to join...", GRAY, 320)
+        self._joined_blit = self._centered(self.status_font, "Player 2 Connected! Starting game...",
+                                           (50, 255, 100), 320)
+        self._instructions_blit = self._centered(self.status_font, "Share this room code with your friend",
+                                                 GRAY, 380)
+    
+    @staticmethod
+    def _centered(font, text, color, y):
+        """(surface, rect) for text horizontally centered at height y"""
+        surf = display_ready(font.render(text, True, color))
+        return surf, surf.get_rect(center=(SCREEN_WIDTH // 2, y))
+    
+    def reset(self, room_id: str, on_cancel: Callable, on_player_joined: Optional[Callable] = None):
+        """Reuse the menu for a new room; only the room code is re-rendered"""
+        self.on_cancel = on_cancel
+        self.on_player_joined = on_player_joined
+        self.buttons[0].callback = on_cancel
+        self.player_joined = False
+        if room_id != self.room_id:
+            self.room_id = room_id
+            self._code_blit = self._centered(self.info_font, f"Room Code: {room_id}", WHITE, 250)
+        self._dirty = True
     
     def set_player_joined(self, joined: bool):
         """Update player joined status"""
         self.player_joined = joined
+        self._dirty = True
         if joined and self.on_player_joined:
             self.on_player_joined()
     
     def handle_event(self, event):
         """Handle events"""
-        self.cancel_button.handle_event(event)
+        self._queue_buttons(event)
     
-    def draw(self):
+    def _redraw(self):
         """Draw the menu"""
         self.screen.fill(BLACK)
         
-        # Draw title
-        title_text = self.title_font.render("Create Room", True, WHITE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 150))
-        self.screen.blit(title_text, title_rect)
-        
-        # Draw room code
-        code_text = self.info_font.render(f"Room Code: {self.room_id}", True, WHITE)
-        code_rect = code_text.get_rect(center=(SCREEN_WIDTH // 2, 250))
-        self.screen.blit(code_text, code_rect)
-        
-        # Draw status
-        if self.player_joined:
-            status_text = self.status_font.render("Player 2 Connected! Starting game...", True, (50, 255, 100))
-        else:
-            status_text = self.status_font.render("Waiting for player 2 to join...", True, GRAY)
-        status_rect = status_text.get_rect(center=(SCREEN_WIDTH // 2, 320))
-        self.screen.blit(status_text, status_rect)
-        
-        # Draw instructions
-        instructions = self.status_font.render("Share this room code with your friend", True, GRAY)
-        inst_rect = instructions.get_rect(center=(SCREEN_WIDTH // 2, 380))
-        self.screen.blit(instructions, inst_rect)
-        
-        # Draw button
-        self.cancel_button.draw(self.screen)
+        # Draw title, room code, status, instructions and buttons in one batch
+        self.screen.blits([
+            (self._title_surf, self._title_rect),
+            self._code_blit,
+            self._joined_blit if self.player_joined else self._waiting_blit,
+            self._instructions_blit,
+        ] + [button.blit_args() for button in self.buttons], doreturn=False)
 
 
-class JoinRoomMenu:
+class JoinRoomMenu(_Menu):
     """Menu for joining a room - input room code"""
     
+    __slots__ = ('screen', 'on_join', 'on_back', 'room_input', 'buttons',
+                 'title_font', '_title_surf', '_title_rect', 'label_font', '_label_surf',
+                 '_label_rect', 'error_message', '_error_blit')
+    
     def __init__(self, screen, on_join: Callable, on_back: Callable):
         self.screen = screen
+        self._dirty = True
+        self._dirty_buttons = []
         self.on_join = on_join
         self.on_back = on_back
         
         center_x = SCREEN_WIDTH // 2
-        button_width = 200
-        button_height = 60
         
         # Room code input
         self.room_input = TextInput(
@@ -692,21 +815,19 @@ class JoinRoomMenu:
             300, 50, initial_value="", numeric=False
         )
         
-        self.join_button = Button(
-            center_x - button_width // 2, SCREEN_HEIGHT // 2 + 50,
-            button_width, button_height, "Join",
-            callback=lambda: self._handle_join()
-        )
-        
-        self.back_button = Button(
-            center_x - button_width // 2, SCREEN_HEIGHT // 2 + 130,
-            button_width, button_height, "Back",
-            callback=lambda: self.on_back()
-        )
-        
-        self.title_font = pygame.font.Font(None, 72)
-        self.label_font = pygame.font.Font(None, 24)
+        self.buttons = _build_button_column([
+            ("Join", self._handle_join),
+            ("Back", on_back),
+        ], center_x, SCREEN_HEIGHT // 2 + 50, w=200)
+        
+        self.title_font = get_font(72)
+        self._title_surf = display_ready(self.title_font.render("Join Room", True, WHITE))
+        self._title_rect = self._title_surf.get_rect(center=(SCREEN_WIDTH // 2, 150))
+        self.label_font = get_font(24)
+        self._label_surf = display_ready(self.label_font.render("Enter Room Code:", True, WHITE))
+        self._label_rect = self._label_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 80))
         self.error_message = None
+        self._error_blit = None
     
     def _handle_join(self):
         """Handle join button click"""
@@ -714,42 +835,37 @@ class JoinRoomMenu:
         if len(room_code) == 6:
             self.on_join(room_code)
         else:
-            self.error_message = "Room code must be 6 characters"
+            self.set_error("Room code must be 6 characters")
     
     def set_error(self, message: str):
-        """Set error message"""
+        """Set error message, rendering it once here rather than on every draw"""
+        if message == self.error_message:
+            return
         self.error_message = message
+        self._dirty = True
+        if message:
+            error_text = display_ready(self.label_font.render(message, True, (255, 50, 50)))
+            self._error_blit = (error_text, error_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20)))
+        else:
+            self._error_blit = None
     
     def handle_event(self, event):
         """Handle events"""
-        self.room_input.handle_event(event)
-        self.join_button.handle_event(event)
-        self.back_button.handle_event(event)
+        if self.room_input.handle_event(event):
+            self._dirty = True
+        self._queue_buttons(event)
     
-    def draw(self):
+    def _redraw(self):
         """Draw the menu"""
         self.screen.fill(BLACK)
         
-        # Draw title
-        title_text = self.title_font.render("Join Room", True, WHITE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 150))
-        self.screen.blit(title_text, title_rect)
-        
-        # Draw label
-        label_text = self.label_font.render("Enter Room Code:", True, WHITE)
-        label_rect = label_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 80))
-        self.screen.blit(label_text, label_rect)
+        # Draw title, label and buttons in one batch
+        self.screen.blits([(self._title_surf, self._title_rect), (self._label_surf, self._label_rect)]
+                          + [button.blit_args() for button in self.buttons], doreturn=False)
         
         # Draw input
         self.room_input.draw(self.screen)
         
         # Draw error message
-        if self.error_message:
-            error_text = self.label_font.render(self.error_message, True, (255, 50, 50))
-            error_rect = error_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
-            self.screen.blit(error_text, error_rect)
-        
-        # Draw buttons
-        self.join_button.draw(self.screen)
-        self.back_button.draw(self.screen)
-
+        if self._error_blit:
+            self.screen.blit(*self._error_blit)
@@ -3,9 +3,11 @@ Network protocol and WebSocket client for multiplayer.
 """
 
 import json
+import struct
 import asyncio
 from typing import Optional, Callable, Dict, Any
 from enum import Enum
+from .protocol import pack_input, unpack_input, is_input_frame, pack_state, unpack_state, is_state_frame
 
 try:
     import websockets
@@ -14,6 +16,28 @@ except ImportError:
     WEBSOCKETS_AVAILABLE = False
     websockets = None
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Frame (de)serializers; orjson emits bytes, which websockets sends as-is.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the latter.
+if ORJSON_AVAILABLE:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
+# Most player inputs kept waiting for the writer; older ones are dropped first
+MAX_PENDING_INPUTS = 64
+
+# game_state messages a client may have in flight before the server grants more credit
+INITIAL_STATE_CREDITS = 32
+
 
 class ConnectionState(Enum):
     """WebSocket connection state"""
@@ -35,6 +59,17 @@ class NetworkClient:
         self.player_num: Optional[int] = None
         self.message_handlers: Dict[str, Callable] = {}
         self.connected = False
+        self._out_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._send_credits = INITIAL_STATE_CREDITS
+        self._credit_event: Optional[asyncio.Event] = None
+        self._credit_gated = False
+        # Messages the client itself tracks; each returns the message to pass on, or None
+        self._protocol_handlers: Dict[str, Callable] = {
+            'room_created': self._on_room_assigned,
+            'room_joined': self._on_room_assigned,
+            'credit': self._on_credit,
+        }
         
     def register_handler(self, message_type: str, handler: Callable):
         """Register a handler for a specific message type"""
@@ -52,8 +87,13 @@ class NetworkClient:
             self.state = ConnectionState.CONNECTED
             self.connected = True
             
-            # Start listening for messages
+            # Start listening for messages and the coalescing input writer
             asyncio.create_task(self._listen())
+            self._out_queue = asyncio.Queue(maxsize=MAX_PENDING_INPUTS)
+            self._writer_task = asyncio.create_task(self._writer())
+            self._send_credits = INITIAL_STATE_CREDITS
+            self._credit_event = asyncio.Event()
+            self._credit_gated = False
             return True
         except Exception as e:
             print(f"Failed to connect to server: {e}")
@@ -62,6 +102,9 @@ class NetworkClient:
     
     async def disconnect(self):
         """Disconnect from the server"""
+        if self._writer_task:
+            self._writer_task.cancel()
+            self._writer_task = None
         if self.websocket:
             await self.websocket.close()
             self.websocket = None
@@ -94,60 +137,141 @@ class NetworkClient:
         return True
     
     async def send_player_input(self, input_data: Dict):
-        """Send player input to server"""
+        """Queue player input for the writer task, which coalesces pending inputs into one frame"""
+        return self.queue_player_input(input_data)
+    
+    def queue_player_input(self, input_data: Dict):
+        """send_player_input for callers already running on the client's loop"""
         if not self.connected or not self.room_id:
             return False
         
-        message = {
-            'type': 'player_input',
-            'input': input_data
-        }
-        await self._send(message)
+        if self._out_queue.full():
+            self._out_queue.get_nowait()  # Slow link: the oldest snapshot is the least useful
+        self._out_queue.put_nowait(input_data)
         return True
     
     async def send_game_state(self, state: Dict):
-        """Send game state update to server"""
+        """Send game state update to server, waiting for credit if the window is used up"""
         if not self.connected or not self.room_id:
             return False
         
-        message = {
-            'type': 'game_state',
-            'state': state
-        }
-        await self._send(message)
+        # States go out as a small binary frame; the only fallback, for a state that
+        # doesn't fit the fixed layout (missing keys, out-of-range scores), is a JSON game_state
+        try:
+            frame = pack_state(state)
+        except (KeyError, TypeError, ValueError, struct.error):
+            frame = None
+        
+        # The server grants credit as it forwards states, so a slow link stalls here
+        # instead of piling up frames in socket buffers. Servers that don't advertise
+        # credit never grant any, so sends to them aren't gated
+        while self._credit_gated and self._send_credits <= 0:
+            self._credit_event.clear()
+            await self._credit_event.wait()
+            if not self.connected:
+                return False
+        self._send_credits -= 1
+        
+        if frame is not None:
+            await self._send_bytes(frame)
+        else:
+            await self._send({
+                'type': 'game_state',
+                'state': state
+            })
         return True
     
     async def _send(self, message: Dict):
         """Send a message to the server"""
         if self.websocket:
             try:
-                await self.websocket.send(json.dumps(message))
+                await self.websocket.send(_dumps(message))
+            except Exception as e:
+                print(f"Error sending message: {e}")
+                self.connected = False
+    
+    async def _send_bytes(self, frame: bytes):
+        """Send a binary frame to the server"""
+        if self.websocket:
+            try:
+                await self.websocket.send(frame)
             except Exception as e:
                 print(f"Error sending message: {e}")
                 self.connected = False
     
+    async def _writer(self):
+        """Send queued player inputs, one frame per batch of whatever piled up meanwhile"""
+        while True:
+            batch = [await self._out_queue.get()]
+            while True:
+                try:
+                    batch.append(self._out_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            
+            # Inputs are absolute snapshots, so the newest one goes out as a binary frame
+            try:
+                frame = pack_input(batch[-1])
+            except (struct.error, TypeError, ValueError):
+                frame = None
+            if frame is not None:
+                await self._send_bytes(frame)
+                continue
+            
+            # Inputs that don't fit the binary layout fall back to JSON
+            if len(batch) == 1:
+                message = {
+                    'type': 'player_input',
+                    'input': batch[0]
+                }
+            else:
+                message = {
+                    'type': 'input_batch',
+                    'inputs': batch
+                }
+            await self._send(message)
+    
+    def _on_room_assigned(self, data: Dict):
+        """Record the room and player number from room_created/room_joined"""
+        self.room_id = data.get('room_id')
+        self.player_num = data.get('player_num')
+        self._credit_gated = bool(data.get('credits'))
+        self.state = ConnectionState.IN_ROOM
+        return data
+    
+    def _on_credit(self, data: Dict):
+        """Add server-granted game_state credit and wake a waiting sender"""
+        self._send_credits += data.get('n', 0)
+        self._credit_event.set()
+        return data
+    
     async def _listen(self):
         """Listen for messages from the server"""
+        protocol_handlers = self._protocol_handlers
+        message_handlers = self.message_handlers
         try:
             async for message in self.websocket:
                 try:
-                    data = json.loads(message)
+                    if is_input_frame(message):
+                        data = unpack_input(message)
+                    elif is_state_frame(message):
+                        data = unpack_state(message)
+                    else:
+                        data = _loads(message)
                     msg_type = data.get('type')
                     
-                    # Handle room creation/joining
-                    if msg_type == 'room_created':
-                        self.room_id = data.get('room_id')
-                        self.player_num = data.get('player_num')
-                        self.state = ConnectionState.IN_ROOM
-                    
-                    elif msg_type == 'room_joined':
-                        self.room_id = data.get('room_id')
-                        self.player_num = data.get('player_num')
-                        self.state = ConnectionState.IN_ROOM
+                    # Client-side protocol bookkeeping first; it may rewrite or swallow the message
+                    hook = protocol_handlers.get(msg_type)
+                    if hook is not None:
+                        data = hook(data)
+                        if data is None:
+                            continue
+                        msg_type = data['type']
                     
                     # Call registered handler
-                    if msg_type in self.message_handlers:
-                        self.message_handlers[msg_type](data)
+                    handler = message_handlers.get(msg_type)
+                    if handler is not None:
+                        handler(data)
                 
                 except json.JSONDecodeError:
                     print("Invalid JSON received from server")
@@ -158,4 +282,8 @@ class NetworkClient:
             print(f"Connection lost: {e}")
             self.connected = False
             self.state = ConnectionState.DISCONNECTED
+        finally:
+            # Wake a send_game_state waiting for credit that will never come
+            if self._credit_event:
+                self._credit_event.set()
 
@@ -3,137 +3,203 @@ Network synchronization helper for pygame integration.
 Handles async websocket operations in a pygame-compatible way.
 """
 
+import asyncio
 import threading
-import queue
 import json
+from collections import deque
 from typing import Optional, Dict, Callable
 from .network import NetworkClient, ConnectionState
+from .platform import is_web
+
+# Remote inputs/states buffered between polls; a bounded deque drops the oldest when full.
+# Only the newest state is ever applied, so few are kept
+MAX_BUFFERED_INPUTS = 128
+MAX_BUFFERED_STATES = 8
+
+# Control messages handed to the game per poll_messages(); the rest wait for the next poll
+MAX_MESSAGES_PER_POLL = 32
+
+# Local inputs held between flush() calls (one flush per frame normally empties it)
+MAX_UNFLUSHED_INPUTS = 32
+
+
+def _drain_deque(dq: deque, limit: Optional[int] = None):
+    """Take everything (or up to limit items) currently in dq (append/popleft are atomic in CPython, so no lock)"""
+    items = []
+    while dq and (limit is None or len(items) < limit):
+        items.append(dq.popleft())
+    return items
 
 
 class NetworkSync:
-    """Thread-safe network client wrapper for pygame"""
+    """Network client wrapper for pygame (thread-backed on desktop, same-loop on web)"""
     
     def __init__(self, server_url: str = "ws://localhost:8765"):
         self.server_url = server_url
         self.client = NetworkClient(server_url)
-        self.message_queue = queue.Queue()
-        self.input_queue = queue.Queue()
-        self.state_queue = queue.Queue()
+        # Control messages are rare and must not be lost, so their deque is unbounded
+        self.message_queue = deque()
+        self.input_queue = deque(maxlen=MAX_BUFFERED_INPUTS)
+        self.state_queue = deque(maxlen=MAX_BUFFERED_STATES)
         self.thread: Optional[threading.Thread] = None
         self.running = False
         self.loop = None
+        self._stop_event = None  # asyncio.Event owned by the network thread's loop
+        # Outgoing game state is last-value-wins: only the newest snapshot is ever sent
+        self._latest_state: Optional[Dict] = None
+        self._state_event = None
+        # Outgoing updates collected during a frame and handed to the network loop by flush()
+        self._unflushed_inputs = deque(maxlen=MAX_UNFLUSHED_INPUTS)
+        self._state_pending = False
     
     def start(self):
-        """Start network client in background thread"""
+        """Start the network client (background thread on desktop, current loop on web)"""
         if self.running:
             return
         
         self.running = True
-        self.thread = threading.Thread(target=self._run_async, daemon=True)
-        self.thread.start()
+        if is_web():
+            # Browsers have no threads; share the asyncio loop the game loop yields to
+            self.loop = asyncio.get_event_loop()
+            self._create_events()
+            self.loop.create_task(self._serve())
+        else:
+            self.thread = threading.Thread(target=self._run_async, daemon=True)
+            self.thread.start()
     
     def stop(self):
         """Stop network client"""
         self.running = False
-        if self.client:
-            # Signal disconnect
-            try:
-                import asyncio
-                if self.loop:
-                    asyncio.run_coroutine_threadsafe(self.client.disconnect(), self.loop)
-            except:
-                pass
+        # Wake the network task; it disconnects in its cleanup
+        try:
+            if self.loop and self._stop_event:
+                self.loop.call_soon_threadsafe(self._stop_event.set)
+        except RuntimeError:
+            pass  # Loop already closed
+    
+    def _create_events(self):
+        """Create the asyncio events on the loop that will wait on them"""
+        self._stop_event = asyncio.Event()
+        self._state_event = asyncio.Event()
     
     def _run_async(self):
-        """Run async network client in thread"""
-        import asyncio
+        """Run the network client on its own event loop (thread mode)"""
         self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
-        
-        # Connect
+        self._create_events()
+        try:
+            self.loop.run_until_complete(self._serve())
+        finally:
+            self.loop.close()
+    
+    def _submit(self, coro):
+        """Schedule a client coroutine on the network loop from the game loop"""
+        if self.thread is None:
+            self.loop.create_task(coro)
+        else:
+            asyncio.run_coroutine_threadsafe(coro, self.loop)
+    
+    async def _serve(self):
+        """Connect, route incoming messages and run until stop() is called"""
+        state_writer = None
         try:
-            self.loop.run_until_complete(self.client.connect())
+            await self.client.connect()
             
             # Register handlers that put messages in queue
-            self.client.register_handler('room_created', lambda d: self.message_queue.put(('room_created', d)))
-            self.client.register_handler('room_joined', lambda d: self.message_queue.put(('room_joined', d)))
-            self.client.register_handler('player_connected', lambda d: self.message_queue.put(('player_connected', d)))
-            self.client.register_handler('player_disconnected', lambda d: self.message_queue.put(('player_disconnected', d)))
-            self.client.register_handler('player_input', lambda d: self.input_queue.put(d))
-            self.client.register_handler('game_state', lambda d: self.state_queue.put(d))
-            self.client.register_handler('error', lambda d: self.message_queue.put(('error', d)))
+            self.client.register_handler('room_created', lambda d: self.message_queue.append(('room_created', d)))
+            self.client.register_handler('room_joined', lambda d: self.message_queue.append(('room_joined', d)))
+            self.client.register_handler('player_connected', lambda d: self.message_queue.append(('player_connected', d)))
+            self.client.register_handler('player_disconnected', lambda d: self.message_queue.append(('player_disconnected', d)))
+            self.client.register_handler('player_input', self.input_queue.append)
+            self.client.register_handler('game_state', self.state_queue.append)
+            self.client.register_handler('error', lambda d: self.message_queue.append(('error', d)))
+            state_writer = asyncio.create_task(self._state_writer())
             
-            # Keep running
-            while self.running:
-                self.loop.run_until_complete(asyncio.sleep(0.1))
+            # Keep running until stop() sets the event (running is cleared first,
+            # so a stop() that raced the event's creation is still seen here)
+            if self.running:
+                await self._stop_event.wait()
         except Exception as e:
             print(f"Network thread error: {e}")
         finally:
+            if state_writer:
+                state_writer.cancel()
             try:
-                self.loop.run_until_complete(self.client.disconnect())
+                await self.client.disconnect()
             except:
                 pass
-            self.loop.close()
+    
+    async def _state_writer(self):
+        """Send the newest game state each time send_state() posts one; stale ones are skipped"""
+        while True:
+            await self._state_event.wait()
+            self._state_event.clear()
+            state, self._latest_state = self._latest_state, None
+            if state is not None:
+                await self.client.send_game_state(state)
     
     def create_room(self):
         """Create a room (non-blocking)"""
         if self.loop and self.client.connected:
-            import asyncio
-            asyncio.run_coroutine_threadsafe(self.client.create_room(), self.loop)
+            self._submit(self.client.create_room())
     
     def join_room(self, room_id: str):
         """Join a room (non-blocking)"""
         if self.loop and self.client.connected:
-            import asyncio
-            asyncio.run_coroutine_threadsafe(self.client.join_room(room_id), self.loop)
+            self._submit(self.client.join_room(room_id))
     
     def send_input(self, input_data: Dict):
-        """Send player input (non-blocking)"""
+        """Send player input (buffered until the next flush())"""
         if self.loop and self.client.connected:
-            import asyncio
-            asyncio.run_coroutine_threadsafe(self.client.send_player_input(input_data), self.loop)
+            self._unflushed_inputs.append(input_data)
     
     def send_state(self, state: Dict):
-        """Send game state (non-blocking)"""
+        """Send game state (buffered until the next flush(), replaces any state not yet sent)"""
+        if self.loop and self.client.connected:
+            self._latest_state = state
+            self._state_pending = True
+    
+    def flush(self):
+        """Hand this frame's buffered inputs/state to the network loop in one wakeup"""
+        if not self._unflushed_inputs and not self._state_pending:
+            return
+        inputs = _drain_deque(self._unflushed_inputs)
+        state_pending, self._state_pending = self._state_pending, False
         if self.loop and self.client.connected:
-            import asyncio
-            asyncio.run_coroutine_threadsafe(self.client.send_game_state(state), self.loop)
+            try:
+                self.loop.call_soon_threadsafe(self._flush_on_loop, inputs, state_pending)
+            except RuntimeError:
+                pass  # Loop already closed
+    
+    def _flush_on_loop(self, inputs, state_pending):
+        """Runs on the network loop: queue inputs for the writer and wake the state writer"""
+        for input_data in inputs:
+            self.client.queue_player_input(input_data)
+        if state_pending:
+            self._state_event.set()
     
     def poll_messages(self):
         """Poll for messages (call from main thread)"""
-        messages = []
-        while not self.message_queue.empty():
-            try:
-                messages.append(self.message_queue.get_nowait())
-            except queue.Empty:
-                break
-        return messages
+        return _drain_deque(self.message_queue, MAX_MESSAGES_PER_POLL)
     
     def poll_input(self):
         """Poll for player input (call from main thread)"""
-        inputs = []
-        while not self.input_queue.empty():
-            try:
-                inputs.append(self.input_queue.get_nowait())
-            except queue.Empty:
-                break
-        return inputs
+        return _drain_deque(self.input_queue)
     
     def poll_state(self):
         """Poll for game state (call from main thread)"""
-        states = []
-        while not self.state_queue.empty():
-            try:
-                states.append(self.state_queue.get_nowait())
-            except queue.Empty:
-                break
-        return states
+        return _drain_deque(self.state_queue)
     
     @property
     def connected(self):
         """Check if connected"""
         return self.client and self.client.connected
     
+    @property
+    def connect_failed(self):
+        """Check if the connection attempt failed"""
+        return self.client.state == ConnectionState.ERROR
+    
     @property
     def room_id(self):
         """Get current room ID"""
@@ -2,37 +2,70 @@
 Physics utilities for collision detection and resolution.
 """
 
-import math
+from math import sqrt
 from .config import PUCK_MASS, HAMMER_MASS, STRIKER_MASS
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python"""
+        return lambda func: func
+
+
+@njit(cache=True)
 def check_collision_circle(x1, y1, r1, x2, y2, r2):
     """Check if two circles are colliding"""
     dx = x2 - x1
     dy = y2 - y1
-    distance = math.sqrt(dx * dx + dy * dy)
-    return distance < (r1 + r2)
+    reach = r1 + r2
+    return dx * dx + dy * dy < reach * reach
 
 
-def resolve_collision(obj1_x, obj1_y, obj1_vx, obj1_vy, obj1_r, obj1_mass,
-                     obj2_x, obj2_y, obj2_vx, obj2_vy, obj2_r, obj2_mass, restitution=1.0):
+@njit(cache=True)
+def check_collision_circle_sq(x1, y1, x2, y2, sum_r_sq):
+    """Check if two circles are colliding, given the precomputed (r1 + r2) ** 2"""
+    dx = x2 - x1
+    dy = y2 - y1
+    return dx * dx + dy * dy < sum_r_sq
+
+
+# Inverse masses of the default bodies, for callers that know what they are colliding
+INV_PUCK_MASS = 1.0 / PUCK_MASS
+INV_HAMMER_MASS = 1.0 / HAMMER_MASS
+INV_STRIKER_MASS = 1.0 / STRIKER_MASS
+
+
+@njit(cache=True)
+def resolve_collision_inv(obj1_x, obj1_y, obj1_vx, obj1_vy, inv_mass1,
+                          obj2_x, obj2_y, obj2_vx, obj2_vy, inv_mass2, restitution=1.0):
     """
-    Resolve collision between two circular objects using elastic collision physics.
+    resolve_collision taking inverse masses, so the impulse needs no mass divisions.
     Returns new velocities for both objects: (vx1, vy1, vx2, vy2)
-    restitution: bounciness factor (1.0 = elastic, <1.0 = inelastic/damped, >1.0 = boosted)
     """
     # Calculate distance between centers
     dx = obj2_x - obj1_x
     dy = obj2_y - obj1_y
-    distance = math.sqrt(dx * dx + dy * dy)
+    distance = sqrt(dx * dx + dy * dy)
     
     # Avoid division by zero
     if distance < 0.01:
         distance = 0.01
     
     # Normalize collision vector
-    nx = dx / distance
-    ny = dy / distance
+    inv_distance = 1.0 / distance
+    nx = dx * inv_distance
+    ny = dy * inv_distance
     
     # Relative velocity
     dvx = obj1_vx - obj2_vx
@@ -48,22 +81,36 @@ def resolve_collision(obj1_x, obj1_y, obj1_vx, obj1_vy, obj1_r, obj1_mass,
     # Collision impulse
     # Impulse magnitude J = -(1+e) * (relative_velocity . normal) / (1/m1 + 1/m2)
     
-    j = -(1 + restitution) * dvn
-    j /= (1 / obj1_mass + 1 / obj2_mass)
+    j = -(1 + restitution) * dvn / (inv_mass1 + inv_mass2)
     
     # Apply impulse
     # v1' = v1 + (J/m1) * n
     # v2' = v2 - (J/m2) * n (Remember relative velocity definition affects signs)
     # Here we calculated relative vel as v1 - v2
+    j1 = j * inv_mass1
+    j2 = j * inv_mass2
     
-    obj1_vx += (j / obj1_mass) * nx
-    obj1_vy += (j / obj1_mass) * ny
-    obj2_vx -= (j / obj2_mass) * nx
-    obj2_vy -= (j / obj2_mass) * ny
+    obj1_vx += j1 * nx
+    obj1_vy += j1 * ny
+    obj2_vx -= j2 * nx
+    obj2_vy -= j2 * ny
     
     return obj1_vx, obj1_vy, obj2_vx, obj2_vy
 
 
+@njit(cache=True)
+def resolve_collision(obj1_x, obj1_y, obj1_vx, obj1_vy, obj1_r, obj1_mass,
+                     obj2_x, obj2_y, obj2_vx, obj2_vy, obj2_r, obj2_mass, restitution=1.0):
+    """
+    Resolve collision between two circular objects using elastic collision physics.
+    Returns new velocities for both objects: (vx1, vy1, vx2, vy2)
+    restitution: bounciness factor (1.0 = elastic, <1.0 = inelastic/damped, >1.0 = boosted)
+    """
+    return resolve_collision_inv(obj1_x, obj1_y, obj1_vx, obj1_vy, 1.0 / obj1_mass,
+                                 obj2_x, obj2_y, obj2_vx, obj2_vy, 1.0 / obj2_mass, restitution)
+
+
+@njit(cache=True)
 def separate_circles(obj1_x, obj1_y, obj1_r, obj2_x, obj2_y, obj2_r):
     """
     Separate two overlapping circles.
@@ -71,7 +118,7 @@ def separate_circles(obj1_x, obj1_y, obj1_r, obj2_x, obj2_y, obj2_r):
     """
     dx = obj2_x - obj1_x
     dy = obj2_y - obj1_y
-    distance = math.sqrt(dx * dx + dy * dy)
+    distance = sqrt(dx * dx + dy * dy)
     
     if distance < 0.01:
         distance = 0.01
@@ -92,3 +139,207 @@ def separate_circles(obj1_x, obj1_y, obj1_r, obj2_x, obj2_y, obj2_r):
     
     return obj1_x, obj1_y, obj2_x, obj2_y
 
+
+@njit(cache=True)
+def collide_circles(obj1_x, obj1_y, obj1_vx, obj1_vy, obj1_r, inv_mass1,
+                    obj2_x, obj2_y, obj2_vx, obj2_vy, obj2_r, inv_mass2, restitution=1.0):
+    """
+    separate_circles followed by resolve_collision_inv for a pair already known to overlap,
+    sharing one distance (and one square root) between the two steps.
+    Returns (x1, y1, vx1, vy1, x2, y2, vx2, vy2)
+    """
+    dx = obj2_x - obj1_x
+    dy = obj2_y - obj1_y
+    distance = sqrt(dx * dx + dy * dy)
+    if distance < 0.01:
+        distance = 0.01
+    
+    # Separation moves both bodies along the normal, so it stays the impulse normal too
+    inv_distance = 1.0 / distance
+    nx = dx * inv_distance
+    ny = dy * inv_distance
+    
+    # Move objects apart, half the overlap each
+    half_overlap = ((obj1_r + obj2_r) - distance) * 0.5
+    if half_overlap > 0:
+        obj1_x -= nx * half_overlap
+        obj1_y -= ny * half_overlap
+        obj2_x += nx * half_overlap
+        obj2_y += ny * half_overlap
+    
+    # Relative velocity in collision normal direction; no impulse if moving apart
+    dvn = (obj1_vx - obj2_vx) * nx + (obj1_vy - obj2_vy) * ny
+    if dvn >= 0:
+        j = -(1 + restitution) * dvn / (inv_mass1 + inv_mass2)
+        j1 = j * inv_mass1
+        j2 = j * inv_mass2
+        obj1_vx += j1 * nx
+        obj1_vy += j1 * ny
+        obj2_vx -= j2 * nx
+        obj2_vy -= j2 * ny
+    
+    return obj1_x, obj1_y, obj1_vx, obj1_vy, obj2_x, obj2_y, obj2_vx, obj2_vy
+
+
+# Rows of a Bodies table
+BODY_X, BODY_Y, BODY_VEL_X, BODY_VEL_Y, BODY_RADIUS, BODY_INV_MASS, BODY_RESTITUTION, BODY_RECOIL = range(8)
+BODY_FIELDS = 8
+
+
+class Bodies:
+    """
+    Circular bodies as one table (structure of arrays): row BODY_X holds every body's x,
+    and so on. A float64 array for the compiled kernels under numba, else a list of lists
+    """
+    
+    def __init__(self, count):
+        if NUMBA_AVAILABLE:
+            self.table = np.zeros((BODY_FIELDS, count))
+        else:
+            self.table = [[0.0] * count for _ in range(BODY_FIELDS)]
+        # Per-row views for field access from Python; memoryviews index several
+        # times faster than the array and hand back plain floats
+        if NUMBA_AVAILABLE:
+            self.rows = [memoryview(self.table[row]) for row in range(BODY_FIELDS)]
+        else:
+            self.rows = self.table
+    
+    def __len__(self):
+        return len(self.rows[0])
+
+
+def body_property(row):
+    """Property reading and writing one field of the owner's entry in its Bodies table"""
+    def fget(self):
+        return self._body_rows[row][self._body_index]
+    
+    def fset(self, value):
+        self._body_rows[row][self._body_index] = value
+    
+    return property(fget, fset)
+
+
+@njit(cache=True)
+def collide_with_bodies(table, target):
+    """
+    Collide body `target` with every other body in the table, in index order, in place.
+    Each other body supplies the pair's restitution; bodies with BODY_RECOIL 0
+    (hammers, which follow their chain) are pushed against but not moved.
+    """
+    xs = table[BODY_X]
+    ys = table[BODY_Y]
+    vxs = table[BODY_VEL_X]
+    vys = table[BODY_VEL_Y]
+    radii = table[BODY_RADIUS]
+    inv_masses = table[BODY_INV_MASS]
+    for i in range(len(xs)):
+        if i == target:
+            continue
+        
+        # Box reject first (the target is usually nowhere near), then the exact squared-distance test
+        reach = radii[target] + radii[i]
+        dx = xs[i] - xs[target]
+        if dx > reach or dx < -reach:
+            continue
+        dy = ys[i] - ys[target]
+        if dy > reach or dy < -reach:
+            continue
+        if dx * dx + dy * dy >= reach * reach:
+            continue
+        
+        # Separate and exchange momentum in one step
+        x, y, vx, vy, body_x, body_y, body_vx, body_vy = collide_circles(
+            xs[target], ys[target], vxs[target], vys[target], radii[target], inv_masses[target],
+            xs[i], ys[i], vxs[i], vys[i], radii[i], inv_masses[i],
+            table[BODY_RESTITUTION][i]
+        )
+        xs[target] = x
+        ys[target] = y
+        vxs[target] = vx
+        vys[target] = vy
+        if table[BODY_RECOIL][i] != 0.0:
+            xs[i] = body_x
+            ys[i] = body_y
+            vxs[i] = body_vx
+            vys[i] = body_vy
+
+
+def check_collisions_batch(xs, ys, radii):
+    """
+    Find every overlapping pair among N circles given as parallel sequences.
+    Returns a list of (i, j) index pairs with i < j.
+    """
+    if NUMPY_AVAILABLE:
+        x = np.asarray(xs, dtype=float)
+        y = np.asarray(ys, dtype=float)
+        r = np.asarray(radii, dtype=float)
+        dx = x[:, None] - x[None, :]
+        dy = y[:, None] - y[None, :]
+        reach = r[:, None] + r[None, :]
+        # Compare squared distances; the upper triangle keeps each pair once
+        hits = np.triu(dx * dx + dy * dy < reach * reach, k=1)
+        return [tuple(pair) for pair in np.argwhere(hits).tolist()]
+    
+    pairs = []
+    n = len(xs)
+    for i in range(n):
+        xi, yi, ri = xs[i], ys[i], radii[i]
+        for j in range(i + 1, n):
+            dx = xs[j] - xi
+            dy = ys[j] - yi
+            reach = ri + radii[j]
+            if dx * dx + dy * dy < reach * reach:
+                pairs.append((i, j))
+    return pairs
+
+
+def resolve_collisions_batch(xs, ys, vxs, vys, masses, pairs, restitution=1.0):
+    """
+    Apply resolve_collision to every (i, j) pair at once.
+    Impulses are computed from the incoming velocities and summed per body.
+    Returns new velocity sequences: (vxs, vys)
+    """
+    if NUMPY_AVAILABLE:
+        vx = np.array(vxs, dtype=float)
+        vy = np.array(vys, dtype=float)
+        if not len(pairs):
+            return vx, vy
+        x = np.asarray(xs, dtype=float)
+        y = np.asarray(ys, dtype=float)
+        inv_m = 1.0 / np.asarray(masses, dtype=float)
+        idx = np.asarray(pairs, dtype=int)
+        i, j = idx[:, 0], idx[:, 1]
+        
+        dx = x[j] - x[i]
+        dy = y[j] - y[i]
+        inv_dist = 1.0 / np.maximum(np.sqrt(dx * dx + dy * dy), 0.01)
+        nx = dx * inv_dist
+        ny = dy * inv_dist
+        dvn = (vx[i] - vx[j]) * nx + (vy[i] - vy[j]) * ny
+        
+        # Pairs already moving apart get no impulse
+        impulse = np.where(dvn < 0, 0.0, -(1 + restitution) * dvn / (inv_m[i] + inv_m[j]))
+        np.add.at(vx, i, impulse * inv_m[i] * nx)
+        np.add.at(vy, i, impulse * inv_m[i] * ny)
+        np.add.at(vx, j, -impulse * inv_m[j] * nx)
+        np.add.at(vy, j, -impulse * inv_m[j] * ny)
+        return vx, vy
+    
+    new_vx = list(vxs)
+    new_vy = list(vys)
+    for i, j in pairs:
+        vx1, vy1, vx2, vy2 = resolve_collision(
+            xs[i], ys[i], vxs[i], vys[i], 0, masses[i],
+            xs[j], ys[j], vxs[j], vys[j], 0, masses[j],
+            restitution=restitution
+        )
+        new_vx[i] += vx1 - vxs[i]
+        new_vy[i] += vy1 - vys[i]
+        new_vx[j] += vx2 - vxs[j]
+        new_vy[j] += vy2 - vys[j]
+    return new_vx, new_vy
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load the cached build) now rather than on the first game frame
+    collide_with_bodies(Bodies(2).table, 0)
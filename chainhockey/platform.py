@@ -4,31 +4,9 @@ Platform detection and web compatibility utilities.
 
 import sys
 
-# Check if running in web environment (pygbag/pygame-web)
-IS_WEB = False
-
-# Method 1: Check for emscripten/wasi platform
-if hasattr(sys, 'platform'):
-    IS_WEB = sys.platform in ('emscripten', 'wasi')
-
-# Method 2: Check for browser globals (pygbag environment)
-if not IS_WEB:
-    try:
-        # In pygbag/web environment, __javascript__ module is available
-        import __javascript__
-        IS_WEB = True
-    except (ImportError, ModuleNotFoundError):
-        pass
-
-# Method 3: Check for window object (browser)
-if not IS_WEB:
-    try:
-        # In browser, window object exists
-        import __javascript__
-        if hasattr(__javascript__, 'window'):
-            IS_WEB = True
-    except (ImportError, ModuleNotFoundError):
-        pass
+# pygbag/pygame-web builds always report an emscripten (or wasi) platform,
+# so one check at import covers the web build without any import probes
+IS_WEB = sys.platform in ('emscripten', 'wasi')
 
 def is_web():
     """Check if running in web/browser environment"""
@@ -36,11 +14,10 @@ def is_web():
 
 def get_storage():
     """Get storage interface (localStorage for web, file for desktop)"""
-    if is_web():
-        try:
-            import __javascript__
-            return __javascript__.localStorage
-        except (ImportError, ModuleNotFoundError):
-            return None
-    return None
-
+    if not IS_WEB:
+        return None
+    try:
+        import __javascript__
+        return __javascript__.localStorage
+    except (ImportError, ModuleNotFoundError, AttributeError):
+        return None
@@ -0,0 +1,82 @@
+"""
+Compact binary frames for high-rate, fixed-shape multiplayer messages.
+Control-plane messages (rooms, errors, credit) stay JSON.
+"""
+
+import struct
+
+# First byte of a binary frame. JSON frames always start with '{', so the two never collide
+TAG_INPUT = 0x01
+TAG_STATE = 0x02
+
+# tag, player_num (0 from clients, filled in by the server), mouse_x, mouse_y, key mask
+INPUT_STRUCT = struct.Struct('<BBhhB')
+
+# tag, puck x, y, vel_x, vel_y, player1_score, player2_score, time_remaining (s), game_over
+STATE_STRUCT = struct.Struct('<B4fHHHB')
+
+# Bit per movement key in the mask
+KEY_BITS = (('w', 1), ('a', 2), ('s', 4), ('d', 8))
+
+
+def pack_input(input_data, player_num=0):
+    """Encode a player_input dict ({mouse_x, mouse_y, keys}) as a binary frame"""
+    keys = input_data.get('keys') or {}
+    mask = 0
+    for key, bit in KEY_BITS:
+        if keys.get(key):
+            mask |= bit
+    return INPUT_STRUCT.pack(TAG_INPUT, player_num,
+                             int(input_data.get('mouse_x', 0)), int(input_data.get('mouse_y', 0)), mask)
+
+
+def unpack_input(frame):
+    """Decode a binary input frame into the dict a JSON player_input message would carry"""
+    _, player_num, mouse_x, mouse_y, mask = INPUT_STRUCT.unpack(frame)
+    return {
+        'type': 'player_input',
+        'player_num': player_num,
+        'input': {
+            'mouse_x': mouse_x,
+            'mouse_y': mouse_y,
+            'keys': {key: bool(mask & bit) for key, bit in KEY_BITS}
+        }
+    }
+
+
+def is_input_frame(message):
+    """Whether a received websocket message is a binary input frame"""
+    return isinstance(message, (bytes, bytearray)) and len(message) == INPUT_STRUCT.size and message[0] == TAG_INPUT
+
+
+def with_player_num(frame, player_num):
+    """Copy of an input frame stamped with the sender's player number (server side)"""
+    return bytes((frame[0], player_num)) + bytes(frame[2:])
+
+
+def pack_state(state):
+    """Encode a game_state dict ({puck, scores, time_remaining, game_over}) as a binary frame"""
+    puck = state['puck']
+    return STATE_STRUCT.pack(TAG_STATE, puck['x'], puck['y'], puck['vel_x'], puck['vel_y'],
+                             state['player1_score'], state['player2_score'],
+                             int(state.get('time_remaining', 0)), bool(state.get('game_over', False)))
+
+
+def unpack_state(frame):
+    """Decode a binary state frame into the dict a JSON game_state message would carry"""
+    _, x, y, vel_x, vel_y, score1, score2, time_remaining, game_over = STATE_STRUCT.unpack(frame)
+    return {
+        'type': 'game_state',
+        'state': {
+            'puck': {'x': x, 'y': y, 'vel_x': vel_x, 'vel_y': vel_y},
+            'player1_score': score1,
+            'player2_score': score2,
+            'time_remaining': time_remaining,
+            'game_over': bool(game_over)
+        }
+    }
+
+
+def is_state_frame(message):
+    """Whether a received websocket message is a binary game state frame"""
+    return isinstance(message, (bytes, bytearray)) and len(message) == STATE_STRUCT.size and message[0] == TAG_STATE
@@ -0,0 +1,69 @@
+"""
+Glyph atlases for drawing frequently-changing menu text without
+re-rendering it through the font engine every frame.
+"""
+
+import pygame
+import string
+from functools import lru_cache
+
+
+# Characters packed into every atlas; anything else falls back to font.render
+ATLAS_CHARS = string.digits + string.ascii_letters + string.punctuation + " "
+
+
+class FontAtlas:
+    """All printable ASCII glyphs of one font/color pre-rendered into a single surface"""
+
+    def __init__(self, font, color):
+        self.font = font
+        self.color = color
+        glyphs = [font.render(c, True, color) for c in ATLAS_CHARS]
+        self.height = max(glyph.get_height() for glyph in glyphs)
+
+        atlas = pygame.Surface((sum(glyph.get_width() for glyph in glyphs), self.height), pygame.SRCALPHA)
+        self.rects = {}
+        x = 0
+        for c, glyph in zip(ATLAS_CHARS, glyphs):
+            atlas.blit(glyph, (x, 0))
+            self.rects[c] = pygame.Rect(x, 0, glyph.get_width(), self.height)
+            x += glyph.get_width()
+        if pygame.display.get_surface() is not None:
+            atlas = atlas.convert_alpha()
+        self.atlas = atlas
+
+    def size(self, text):
+        """Width and height the text will occupy"""
+        width = 0
+        for c in text:
+            rect = self.rects.get(c)
+            width += rect.width if rect else self.font.size(c)[0]
+        return width, self.height
+
+    def draw_text(self, dst, text, pos):
+        """Typeset text onto dst at pos by copying glyph rects. Returns the covered Rect"""
+        x, y = pos
+        atlas = self.atlas
+        rects = self.rects
+        for c in text:
+            rect = rects.get(c)
+            if rect is not None:
+                dst.blit(atlas, (x, y), rect)
+                x += rect.width
+            else:
+                glyph = self.font.render(c, True, self.color)
+                dst.blit(glyph, (x, y))
+                x += glyph.get_width()
+        return pygame.Rect(pos[0], y, x - pos[0], self.height)
+
+    def render(self, text):
+        """Typeset text into a new transparent surface (for caching like font.render)"""
+        surf = pygame.Surface(self.size(text), pygame.SRCALPHA)
+        self.draw_text(surf, text, (0, 0))
+        return surf
+
+
+@lru_cache(maxsize=32)
+def get_atlas(font, color):
+    """Shared atlas for a (cached) font in the given color"""
+    return FontAtlas(font, color)
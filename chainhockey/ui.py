@@ -3,7 +3,71 @@ UI components for menus and options screens.
 """
 
 import pygame
+from functools import lru_cache
 from typing import Callable, Optional
+from .text_atlas import get_atlas
+
+
+# Font objects shared by every widget, keyed by (name, size)
+_FONT_CACHE = {}
+
+
+def get_font(size, name=None):
+    """Return the shared pygame Font for (name, size), loading it on first use"""
+    key = (name, size)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = pygame.font.Font(name, size)
+    return font
+
+
+def clear_font_cache():
+    """Drop cached fonts and everything rendered from them (e.g. before pygame.quit())"""
+    _FONT_CACHE.clear()
+    render_cached.cache_clear()
+    get_atlas.cache_clear()
+
+
+def display_ready(surf):
+    """
+    Convert a long-lived surface to the display's pixel format so later
+    blits are plain copies instead of per-call format conversions.
+    Returns the surface unchanged when no display mode is set yet.
+    """
+    if pygame.display.get_surface() is None:
+        return surf
+    if surf.get_flags() & pygame.SRCALPHA:
+        return surf.convert_alpha()
+    return surf.convert()
+
+
+@lru_cache(maxsize=256)
+def render_cached(font, text, color):
+    """Render text once per (font, text, color) and reuse the surface"""
+    return display_ready(font.render(text, True, color))
+
+
+def coalesce_events(events):
+    """
+    Collapse runs of adjacent MOUSEMOTION events into the latest one and
+    runs of adjacent MOUSEWHEEL events into a single summed event.
+    Ordering relative to clicks and key presses is preserved.
+    """
+    coalesced = []
+    for event in events:
+        if coalesced:
+            last = coalesced[-1]
+            if event.type == pygame.MOUSEMOTION and last.type == pygame.MOUSEMOTION:
+                coalesced[-1] = event
+                continue
+            if event.type == pygame.MOUSEWHEEL and last.type == pygame.MOUSEWHEEL:
+                attrs = dict(event.dict)
+                attrs['x'] = last.x + event.x
+                attrs['y'] = last.y + event.y
+                coalesced[-1] = pygame.event.Event(pygame.MOUSEWHEEL, attrs)
+                continue
+        coalesced.append(event)
+    return coalesced
 
 
 class Button:
@@ -14,17 +78,35 @@ class Button:
                  text_color=(255, 255, 255), callback: Optional[Callable] = None):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
-        self.font = pygame.font.Font(None, font_size)
+        self.font = get_font(font_size)
         self.color = color
         self.hover_color = hover_color
         self.text_color = text_color
         self.callback = callback
         self.hovered = False
+        self._surf_normal = self._compose(self.color)
+        self._surf_hover = self._compose(self.hover_color)
+    
+    def _compose(self, color):
+        """Pre-render background, border and text into one surface"""
+        surf = pygame.Surface(self.rect.size)
+        surf.fill(color)
+        pygame.draw.rect(surf, (255, 255, 255), surf.get_rect(), 2)
+        text_surface = self.font.render(self.text, True, self.text_color)
+        surf.blit(text_surface, text_surface.get_rect(center=surf.get_rect().center))
+        return display_ready(surf)
+    
+    def blit_args(self):
+        """(surface, rect) pair for batching with Surface.blits"""
+        return (self._surf_hover if self.hovered else self._surf_normal), self.rect
     
     def handle_event(self, event):
-        """Handle pygame events"""
+        """Handle pygame events. Returns True if the button's appearance changed or it was clicked"""
         if event.type == pygame.MOUSEMOTION:
-            self.hovered = self.rect.collidepoint(event.pos)
+            hovered = self.rect.collidepoint(event.pos)
+            if hovered != self.hovered:
+                self.hovered = hovered
+                return True
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1 and self.rect.collidepoint(event.pos):
                 if self.callback:
@@ -34,13 +116,7 @@ class Button:
     
     def draw(self, screen):
         """Draw the button"""
-        color = self.hover_color if self.hovered else self.color
-        pygame.draw.rect(screen, color, self.rect)
-        pygame.draw.rect(screen, (255, 255, 255), self.rect, 2)
-        
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        screen.blit(*self.blit_args())
 
 
 class Slider:
@@ -56,10 +132,32 @@ class Slider:
         self.label = label
         self.callback = callback
         self.dragging = False
-        self.font = pygame.font.Font(None, 24)
+        self.atlas = get_atlas(get_font(24), (255, 255, 255))
+        self._value_text = None
+        self._value_surf = None
+        self._bake_background()
+    
+    def _bake_background(self):
+        """Pre-render the track and label prefix into one surface plus a reusable handle surface"""
+        prefix = f"{self.label}: " if self.label else ""
+        self._value_dx = self.atlas.size(prefix)[0]
+        
+        # Background spans from the label line (25px above the track) to the track bottom
+        width = max(self.rect.width, self._value_dx)
+        bg = pygame.Surface((width, self.rect.height + 25), pygame.SRCALPHA)
+        track = pygame.Rect(0, 25, self.rect.width, self.rect.height)
+        pygame.draw.rect(bg, (100, 100, 100), track)
+        pygame.draw.rect(bg, (255, 255, 255), track, 1)
+        self.atlas.draw_text(bg, prefix, (0, 0))
+        self._bg_surf = display_ready(bg)
+        
+        handle = pygame.Surface((16, 30))
+        handle.fill((200, 200, 200))
+        pygame.draw.rect(handle, (255, 255, 255), handle.get_rect(), 2)
+        self._handle_surf = display_ready(handle)
     
     def handle_event(self, event):
-        """Handle pygame events"""
+        """Handle pygame events. Returns True if the slider was grabbed or moved"""
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1 and self.rect.collidepoint(event.pos):
                 self.dragging = True
@@ -87,23 +185,27 @@ class Slider:
             if self.callback:
                 self.callback(self.value)
     
-    def draw(self, screen):
-        """Draw the slider"""
-        # Draw track
-        pygame.draw.rect(screen, (100, 100, 100), self.rect)
-        pygame.draw.rect(screen, (255, 255, 255), self.rect, 1)
+    def set_value(self, value):
+        """Set the value directly (clamped, without firing the callback)"""
+        self.value = max(self.min_val, min(self.max_val, value))
+    
+    def draw(self, screen, offset_y=0):
+        """Draw the slider, shifted up by offset_y (used for scrolling)"""
+        rect = self.rect.move(0, -offset_y) if offset_y else self.rect
         
-        # Draw handle
+        # Draw baked track and label, then the handle on top
+        screen.blit(self._bg_surf, (rect.x, rect.y - 25))
         ratio = (self.value - self.min_val) / (self.max_val - self.min_val) if self.max_val != self.min_val else 0
-        handle_x = self.rect.left + ratio * self.rect.width
-        handle_rect = pygame.Rect(handle_x - 8, self.rect.top - 5, 16, 30)
-        pygame.draw.rect(screen, (200, 200, 200), handle_rect)
-        pygame.draw.rect(screen, (255, 255, 255), handle_rect, 2)
+        handle_x = rect.left + ratio * rect.width
+        screen.blit(self._handle_surf, (int(handle_x) - 8, rect.top - 5))
         
-        # Draw label and value
+        # Draw the value after the baked label (re-typeset only when it changes)
         if self.label:
-            label_text = self.font.render(f"{self.label}: {self.value:.2f}", True, (255, 255, 255))
-            screen.blit(label_text, (self.rect.x, self.rect.y - 25))
+            value_text = f"{self.value:.2f}"
+            if value_text != self._value_text:
+                self._value_text = value_text
+                self._value_surf = self.atlas.render(value_text)
+            screen.blit(self._value_surf, (rect.x + self._value_dx, rect.y - 25))
 
 
 class TextInput:
@@ -119,13 +221,29 @@ class TextInput:
         self.max_val = max_val
         self.callback = callback
         self.active = False
-        self.font = pygame.font.Font(None, 24)
+        self.atlas = get_atlas(get_font(24), (255, 255, 255))
+        self._surf_text = None
+        self._text_surf = None
+        self._box_normal = self._compose_box((100, 100, 100))
+        self._box_active = self._compose_box((150, 150, 150))
+        self._cursor_surf = pygame.Surface((2, max(1, height - 9)))
+        self._cursor_surf.fill((255, 255, 255))
+    
+    def _compose_box(self, color):
+        """Pre-render the filled, bordered input box"""
+        surf = pygame.Surface(self.rect.size)
+        surf.fill(color)
+        pygame.draw.rect(surf, (255, 255, 255), surf.get_rect(), 2)
+        return display_ready(surf)
     
     def handle_event(self, event):
-        """Handle pygame events"""
+        """Handle pygame events. Returns True if the text or focus changed"""
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:
-                self.active = self.rect.collidepoint(event.pos)
+                active = self.rect.collidepoint(event.pos)
+                if active != self.active:
+                    self.active = active
+                    return True
         elif event.type == pygame.KEYDOWN:
             if self.active:
                 if event.key == pygame.K_RETURN:
@@ -170,23 +288,20 @@ class TextInput:
                 return 0.0
         return self.text
     
-    def draw(self, screen):
-        """Draw the text input"""
-        color = (150, 150, 150) if self.active else (100, 100, 100)
-        pygame.draw.rect(screen, color, self.rect)
-        pygame.draw.rect(screen, (255, 255, 255), self.rect, 2)
+    def draw(self, screen, offset_y=0):
+        """Draw the text input, shifted up by offset_y (used for scrolling)"""
+        rect = self.rect.move(0, -offset_y) if offset_y else self.rect
+        screen.blit(self._box_active if self.active else self._box_normal, rect)
         
-        text_surface = self.font.render(self.text, True, (255, 255, 255))
-        # Clip text to fit in rect
-        text_rect = text_surface.get_rect(left=self.rect.left + 5, centery=self.rect.centery)
-        screen.blit(text_surface, text_rect)
+        # Re-typeset the text only after it was edited
+        if self.text != self._surf_text:
+            self._surf_text = self.text
+            self._text_surf = self.atlas.render(self.text)
+        text_rect = screen.blit(self._text_surf, (rect.left + 5, rect.centery - self.atlas.height // 2))
         
         # Draw cursor if active
         if self.active:
-            cursor_x = text_rect.right + 2
-            pygame.draw.line(screen, (255, 255, 255), 
-                           (cursor_x, self.rect.top + 5),
-                           (cursor_x, self.rect.bottom - 5), 2)
+            screen.blit(self._cursor_surf, (text_rect.right + 2, rect.top + 5))
 
 
 class Label:
@@ -196,15 +311,17 @@ class Label:
         self.x = x
         self.y = y
         self.text = text
-        self.font = pygame.font.Font(None, font_size)
+        self.font = get_font(font_size)
         self.color = color
+        self._surf = display_ready(self.font.render(self.text, True, self.color))
     
     def set_text(self, text):
         """Update label text"""
-        self.text = text
+        if text != self.text:
+            self.text = text
+            self._surf = display_ready(self.font.render(self.text, True, self.color))
     
-    def draw(self, screen):
-        """Draw the label"""
-        text_surface = self.font.render(self.text, True, self.color)
-        screen.blit(text_surface, (self.x, self.y))
+    def draw(self, screen, offset_y=0):
+        """Draw the label, shifted up by offset_y (used for scrolling)"""
+        screen.blit(self._surf, (self.x, self.y - offset_y))
 
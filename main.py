@@ -2,25 +2,65 @@
 Chain Hockey - Entry point for the game.
 """
 
+import asyncio
 import pygame
 import sys
 import time
+from functools import partial
 from chainhockey.config_manager import ConfigManager
 from chainhockey.game import ChainHockeyGame, GameState
 from chainhockey.menu import (StartMenu, PauseMenu, OptionsMenu, MenuState,
                              ServerSelectionMenu, MultiplayerMenu, CreateRoomMenu, JoinRoomMenu)
-from chainhockey.network_sync import NetworkSync
-from chainhockey.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from chainhockey.ui import coalesce_events, clear_font_cache
+from chainhockey.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, MENU_FPS
 
+# Seconds to wait for the server to connect and answer a create/join request
+HANDSHAKE_TIMEOUT = 3.0
+# Seconds the host sees "player joined" before the match starts
+AUTO_START_DELAY = 1.0
+# Events handled per frame; the rest wait (in order) for the next frame
+MAX_EVENTS_PER_FRAME = 64
+# The game advances in fixed ticks of real time (its speeds and delays are per tick).
+# A frame within FRAME_SNAP seconds of one tick counts as exactly one, so normal
+# pacing never alternates 0 and 2 ticks; a hitch catches up by at most MAX_TICKS_PER_FRAME
+TICK_SECONDS = 1.0 / FPS
+FRAME_SNAP = 0.002
+MAX_TICKS_PER_FRAME = 4
+# Mouse events nothing reads during play (strikers poll pygame.mouse.get_pos()),
+# kept out of the queue while in game
+GAME_BLOCKED_EVENTS = [pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                       pygame.MOUSEWHEEL]
 
-def main():
+
+class LoopState:
+    """Current and previous MenuState of the main loop"""
+    
+    __slots__ = ('current', 'previous')
+    
+    def __init__(self, initial):
+        self.current = initial
+        self.previous = initial  # Track where we came from
+    
+    def set(self, new_state):
+        """Switch to new_state, remembering the state we left"""
+        self.previous = self.current
+        self.current = new_state
+
+
+async def main():
     """Initialize and run the game"""
     pygame.init()
     
-    # Set up display
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    # Set up display: a GPU-composited, vsynced window where the platform allows it
+    try:
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT),
+                                         pygame.DOUBLEBUF | pygame.SCALED, vsync=1)
+    except pygame.error:
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Chain Hockey - Meteor Hammer")
     clock = pygame.time.Clock()
+    # Reused for the frozen game frame behind the pause menu instead of copying per pause
+    frozen_frame = pygame.Surface(screen.get_size()).convert()
     
     # Initialize config manager
     config_manager = ConfigManager()
@@ -29,9 +69,8 @@ def main():
     # Create game instance
     game = ChainHockeyGame(config_manager.get_config())
     
-    # Menu state - use a list to allow modification in closures
-    game_state = [MenuState.START]
-    previous_state = [MenuState.START]  # Track where we came from
+    # Menu state, shared with the menu callbacks below
+    loop_state = LoopState(MenuState.START)
     
     # Network sync (will be initialized when needed)
     network_sync = None
@@ -40,82 +79,127 @@ def main():
     multiplayer_menu = None
     create_room_menu = None
     join_room_menu = None
+    pause_menu = None
+    options_menu = None
     
     # Create menus with proper callbacks
-    def set_state(new_state):
-        previous_state[0] = game_state[0]
-        game_state[0] = new_state
+    set_state = loop_state.set
     
-    def handle_create_room():
-        """Handle creating a room"""
-        nonlocal network_sync, create_room_menu, set_state
-        if not network_sync:
+    # Request waiting on the connection/server reply:
+    # {'submit', 'wanted', 'on_reply', 'timeout_message', 'sent', 'deadline', 'origin'}
+    handshake = [None]
+    auto_start_at = [None]  # When a host whose opponent joined enters the game
+    
+    def await_reply(submit, wanted, on_reply, timeout_message):
+        """
+        Connect (if needed), then let poll_handshake send submit(network_sync) and
+        call on_reply(data) once a `wanted` message arrives
+        """
+        nonlocal network_sync
+        if not network_sync or not network_sync.running:
+            # Imported on first use so single-player never loads websockets
+            from chainhockey.network_sync import NetworkSync
             network_sync = NetworkSync(server_url)
             network_sync.start()
-        
-        # Wait for connection
-        time.sleep(0.5)
-        
-        if network_sync.connected:
-            network_sync.create_room()
-            # Wait for response
-            time.sleep(0.5)
-            messages = network_sync.poll_messages()
-            for msg_type, data in messages:
-                if msg_type == 'room_created':
-                    room_id = data.get('room_id')
-                    # Create menu with room ID
-                    create_room_menu = CreateRoomMenu(
-                        screen,
-                        room_id=room_id,
-                        on_cancel=lambda: (network_sync.stop() if network_sync else None, set_state(MenuState.MULTIPLAYER)),
-                        on_player_joined=lambda: (game.set_multiplayer(network_sync, is_host=True), set_state(MenuState.GAME))
-                    )
-                    set_state(MenuState.CREATE_ROOM)
-                    return
-            # Error creating room
-            print("Failed to create room")
+        auto_start_at[0] = None
+        handshake[0] = {
+            'submit': submit,
+            'wanted': wanted,
+            'on_reply': on_reply,
+            'timeout_message': timeout_message,
+            'sent': False,
+            'deadline': time.monotonic() + HANDSHAKE_TIMEOUT,
+            'origin': loop_state.current  # Leaving this screen abandons the request
+        }
+    
+    def abandon_handshake():
+        """
+        Forget the pending request. One already sent is cut off with its connection,
+        so a late reply (or the room it made) can't be picked up by a later request
+        """
+        pending, handshake[0] = handshake[0], None
+        if pending and pending['sent'] and network_sync:
+            network_sync.stop()
+    
+    def cancel_room():
+        if network_sync:
+            network_sync.stop()
+        set_state(MenuState.MULTIPLAYER)
+    
+    def room_created(data):
+        nonlocal create_room_menu
+        # Show the room code; the menu is built once and reused for later rooms.
+        # tick_create_room starts the match itself after AUTO_START_DELAY
+        if create_room_menu is None:
+            create_room_menu = CreateRoomMenu(screen, room_id=data.get('room_id'), on_cancel=cancel_room)
         else:
-            print("Not connected to server")
+            create_room_menu.reset(data.get('room_id'), on_cancel=cancel_room)
+        set_state(MenuState.CREATE_ROOM)
+    
+    def room_joined(data):
+        # Successfully joined
+        game.set_multiplayer(network_sync, is_host=False)
+        set_state(MenuState.GAME)
+    
+    def handle_create_room():
+        """Handle creating a room"""
+        await_reply(lambda sync: sync.create_room(), 'room_created', room_created, "Failed to create room")
     
     def handle_join_room(room_id: str):
         """Handle joining a room"""
-        nonlocal network_sync, join_room_menu, set_state
-        if not network_sync:
-            network_sync = NetworkSync(server_url)
-            network_sync.start()
+        await_reply(lambda sync: sync.join_room(room_id), 'room_joined', room_joined,
+                    "Failed to join room. Check room code.")
+    
+    def handshake_failed(message):
+        """Drop the pending request and report why"""
+        handshake[0] = None
+        if join_room_menu and loop_state.current == MenuState.JOIN_ROOM:
+            join_room_menu.set_error(message)
+        else:
+            print(message)
+    
+    def poll_handshake():
+        """Advance a pending request by one frame without blocking the UI"""
+        pending = handshake[0]
+        if not pending:
+            return
         
-        # Wait a bit for connection
-        time.sleep(0.5)
+        # The user backed out of the screen that made the request
+        if loop_state.current != pending['origin']:
+            abandon_handshake()
+            return
         
-        if network_sync.connected:
-            network_sync.join_room(room_id)
-            # Wait for response
-            time.sleep(0.5)
-            messages = network_sync.poll_messages()
-            for msg_type, data in messages:
-                if msg_type == 'room_joined':
-                    # Successfully joined
-                    game.set_multiplayer(network_sync, is_host=False)
-                    set_state(MenuState.GAME)
-                    return
-                elif msg_type == 'error':
-                    if join_room_menu:
-                        join_room_menu.set_error(data.get('message', 'Failed to join room'))
-            # If no response, show error
-            if join_room_menu:
-                join_room_menu.set_error("Failed to join room. Check room code.")
-        else:
-            if join_room_menu:
-                join_room_menu.set_error("Not connected to server")
+        # Replies after the deadline are dropped, not dispatched
+        if time.monotonic() > pending['deadline']:
+            if pending['sent'] and network_sync:
+                network_sync.stop()
+            handshake_failed(pending['timeout_message'] if pending['sent'] else "Not connected to server")
+            return
+        
+        if not pending['sent']:
+            if network_sync.connected:
+                pending['submit'](network_sync)
+                pending['sent'] = True
+            elif network_sync.connect_failed:
+                handshake_failed("Not connected to server")
+                return
+        
+        for msg_type, data in network_sync.poll_messages():
+            if msg_type == pending['wanted']:
+                handshake[0] = None
+                pending['on_reply'](data)
+                return
+            elif msg_type == 'error':
+                handshake_failed(data.get('message', 'Failed to join room'))
+                return
     
     def create_server_selection_menu():
         nonlocal server_selection_menu
         if not server_selection_menu:
             server_selection_menu = ServerSelectionMenu(
                 screen,
-                on_connect=lambda url: handle_server_connect(url),
-                on_back=lambda: set_state(MenuState.START)
+                on_connect=handle_server_connect,
+                on_back=partial(set_state, MenuState.START)
             )
         return server_selection_menu
     
@@ -129,9 +213,9 @@ def main():
         if not multiplayer_menu:
             multiplayer_menu = MultiplayerMenu(
                 screen,
-                on_create_room=lambda: handle_create_room(),
-                on_join_room=lambda: set_state(MenuState.JOIN_ROOM),
-                on_back=lambda: set_state(MenuState.START)
+                on_create_room=handle_create_room,
+                on_join_room=partial(set_state, MenuState.JOIN_ROOM),
+                on_back=partial(set_state, MenuState.START)
             )
         return multiplayer_menu
     
@@ -140,175 +224,271 @@ def main():
         if not join_room_menu:
             join_room_menu = JoinRoomMenu(
                 screen,
-                on_join=lambda room_id: handle_join_room(room_id),
-                on_back=lambda: set_state(MenuState.MULTIPLAYER)
+                on_join=handle_join_room,
+                on_back=partial(set_state, MenuState.MULTIPLAYER)
             )
         return join_room_menu
     
     start_menu = StartMenu(
         screen,
-        on_start=lambda: set_state(MenuState.GAME),
-        on_options=lambda: set_state(MenuState.OPTIONS),
-        on_exit=lambda: set_state(MenuState.EXIT),
-        on_multiplayer=lambda: set_state(MenuState.SERVER_SELECT)
+        on_start=partial(set_state, MenuState.GAME),
+        on_options=partial(set_state, MenuState.OPTIONS),
+        on_exit=partial(set_state, MenuState.EXIT),
+        on_multiplayer=partial(set_state, MenuState.SERVER_SELECT)
     )
     
-    pause_menu = PauseMenu(
-        screen,
-        on_resume=lambda: set_state(MenuState.GAME),
-        on_options=lambda: set_state(MenuState.OPTIONS),
-        on_main_menu=lambda: set_state(MenuState.START)
-    )
+    def create_pause_menu():
+        nonlocal pause_menu
+        if not pause_menu:
+            pause_menu = PauseMenu(
+                screen,
+                on_resume=partial(set_state, MenuState.GAME),
+                on_options=partial(set_state, MenuState.OPTIONS),
+                on_main_menu=partial(set_state, MenuState.START)
+            )
+        return pause_menu
     
     def options_back():
         # Return to previous state (either START or PAUSE)
-        if previous_state[0] == MenuState.START:
+        if loop_state.previous == MenuState.START:
             set_state(MenuState.START)
         else:
             set_state(MenuState.PAUSE)
     
-    options_menu = OptionsMenu(
-        screen,
-        config_manager,
-        on_back=options_back
-    )
+    def create_options_menu():
+        # Options builds dozens of widgets, so only pay for it once it is opened
+        nonlocal options_menu
+        if not options_menu:
+            options_menu = OptionsMenu(
+                screen,
+                config_manager,
+                on_back=options_back
+            )
+        return options_menu
+    
+    # Entry work for each state, run once when it becomes current; each returns
+    # the menu to show (None while playing)
+    def enter_start():
+        game.state = GameState.MENU
+        abandon_handshake()  # Back from MULTIPLAYER with a create still pending
+        return start_menu
+    
+    def enter_server_select():
+        game.state = GameState.MENU
+        return create_server_selection_menu()
+    
+    def enter_multiplayer():
+        game.state = GameState.MENU
+        return create_multiplayer_menu()
+    
+    def enter_create_room():
+        if not create_room_menu:
+            return create_multiplayer_menu()
+        game.state = GameState.MENU
+        return create_room_menu
+    
+    def enter_join_room():
+        game.state = GameState.MENU
+        return create_join_room_menu()
+    
+    def enter_game():
+        if game.state == GameState.PAUSED:
+            # Resuming from pause - don't reset game, just resume timer
+            game.resume_timer()
+        elif game.state != GameState.PLAYING:
+            # Starting new game
+            game.start_game()
+        game.state = GameState.PLAYING
+        return None
+    
+    def enter_pause():
+        if game.state == GameState.PLAYING:
+            # Just paused
+            game.pause_timer()
+        game.state = GameState.PAUSED
+        return create_pause_menu()
+    
+    def enter_options():
+        # OptionsMenu edits the config manager's GameConfig in place (and points the
+        # manager back at it after loads/resets), so there is no reference to refresh
+        game.state = GameState.OPTIONS
+        return create_options_menu()
+    
+    # Per-frame work for states that wait on the network
+    def tick_create_room():
+        if not create_room_menu:
+            return
+        # Check for player joined
+        if network_sync and auto_start_at[0] is None:
+            messages = network_sync.poll_messages()
+            for msg_type, data in messages:
+                if msg_type == 'player_connected':
+                    create_room_menu.set_player_joined(True)
+                    # Auto-start game after a short delay, rendering "joined" meanwhile
+                    auto_start_at[0] = time.monotonic() + AUTO_START_DELAY
+        if auto_start_at[0] is not None and time.monotonic() >= auto_start_at[0]:
+            auto_start_at[0] = None
+            game.set_multiplayer(network_sync, is_host=True)
+            set_state(MenuState.GAME)
+    
+    # state -> (entry handler, per-frame handler or None, whether its menu is drawn over the frozen game)
+    state_table = {
+        MenuState.START: (enter_start, None, False),
+        MenuState.SERVER_SELECT: (enter_server_select, None, False),
+        MenuState.MULTIPLAYER: (enter_multiplayer, poll_handshake, False),
+        MenuState.CREATE_ROOM: (enter_create_room, tick_create_room, False),
+        MenuState.JOIN_ROOM: (enter_join_room, poll_handshake, False),
+        MenuState.GAME: (enter_game, None, False),
+        MenuState.PAUSE: (enter_pause, None, True),
+        MenuState.OPTIONS: (enter_options, None, False),
+    }
     
     # Main loop
     running = True
     current_menu = None
+    drawn_menu = None  # Menu whose contents are currently on screen
+    deferred_events = []
+    entered_state = None
+    tick_state = None
+    overlay = False
+    frame_rate = FPS
+    tick_time = 0.0  # Real time not yet simulated
+    last_tick_check = None  # When play last advanced; None while not playing
+    
+    # Per-frame lookups bound to locals once
+    event_get = pygame.event.get
+    display_flip = pygame.display.flip
+    display_update = pygame.display.update
+    clock_tick = clock.tick
+    perf_counter = time.perf_counter
+    game_screen = game.get_screen()
+    QUIT, KEYDOWN = pygame.QUIT, pygame.KEYDOWN
+    K_ESCAPE, K_SPACE = pygame.K_ESCAPE, pygame.K_SPACE
+    PLAYING = GameState.PLAYING
     
     while running:
-        state = game_state[0]
+        state = loop_state.current
+        if state == MenuState.EXIT:
+            break
         
-        # Handle state transitions
-        if state == MenuState.START:
-            current_menu = start_menu
-            game.state = GameState.MENU
-        elif state == MenuState.SERVER_SELECT:
-            current_menu = create_server_selection_menu()
-            game.state = GameState.MENU
-        elif state == MenuState.MULTIPLAYER:
-            current_menu = create_multiplayer_menu()
-            game.state = GameState.MENU
-        elif state == MenuState.CREATE_ROOM:
-            if not create_room_menu:
-                handle_create_room()
-            if create_room_menu:
-                current_menu = create_room_menu
-                game.state = GameState.MENU
-                # Check for player joined
-                if network_sync:
-                    messages = network_sync.poll_messages()
-                    for msg_type, data in messages:
-                        if msg_type == 'player_connected':
-                            create_room_menu.set_player_joined(True)
-                            # Auto-start game after short delay
-                            time.sleep(1)
-                            game.set_multiplayer(network_sync, is_host=True)
-                            set_state(MenuState.GAME)
+        # Handle state transitions (entry work only runs when the state changes)
+        if state != entered_state:
+            entered_state = state
+            enter_state, tick_state, overlay = state_table[state]
+            # Leaving the pause overlay: the frozen frame is stale once anything else is shown
+            if not overlay:
+                game._paused_screen = None
+            current_menu = enter_state()
+            if state == MenuState.GAME:
+                frame_rate = FPS
+                pygame.event.set_blocked(GAME_BLOCKED_EVENTS)
+                pygame.mouse.set_visible(False)  # The striker is the pointer; skip cursor compositing
             else:
-                current_menu = create_multiplayer_menu()
-        elif state == MenuState.JOIN_ROOM:
-            current_menu = create_join_room_menu()
-            game.state = GameState.MENU
-        elif state == MenuState.GAME:
-            if game.state != GameState.PLAYING:
-                if game.state == GameState.PAUSED:
-                    # Resuming from pause - don't reset game, just resume timer
-                    game.resume_timer()
-                    # Clear paused screen
-                    if hasattr(game, '_paused_screen'):
-                        del game._paused_screen
-                    game.state = GameState.PLAYING
-                else:
-                    # Starting new game
-                    game.start_game()
-                    game.state = GameState.PLAYING
-            current_menu = None
-        elif state == MenuState.PAUSE:
-            if game.state == GameState.PLAYING:
-                # Just paused
-                game.pause_timer()
-            game.state = GameState.PAUSED
-            current_menu = pause_menu
-        elif state == MenuState.OPTIONS:
-            game.state = GameState.OPTIONS
-            current_menu = options_menu
-            # Update options menu config reference
-            options_menu.config = config_manager.get_config()
-        elif state == MenuState.EXIT:
-            running = False
-            break
+                frame_rate = MENU_FPS
+                pygame.event.set_allowed(GAME_BLOCKED_EVENTS)
+                pygame.mouse.set_visible(True)
+        if tick_state:
+            tick_state()
         
-        # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        # Handle events (motion/wheel bursts collapsed to one dispatch each), capped
+        # so an event storm can't stall update/flip; leftovers run first next frame
+        events = deferred_events + coalesce_events(event_get())
+        deferred_events = events[MAX_EVENTS_PER_FRAME:]
+        for event in events[:MAX_EVENTS_PER_FRAME]:
+            if event.type == QUIT:
                 running = False
                 break
             
             # Handle game events (only when playing)
-            if game.state == GameState.PLAYING:
+            if game.state == PLAYING:
                 # Handle ESC key for pause
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                if event.type == KEYDOWN and event.key == K_ESCAPE:
                     game.state = GameState.PAUSED
                     set_state(MenuState.PAUSE)
                     continue  # Don't process this event further
                 # Handle Space key
-                elif event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                elif event.type == KEYDOWN and event.key == K_SPACE:
                     if game.game_over:
                         game.reset_game()
                     elif game.puck:
                         game.puck.reset()
                     continue  # Don't process this event further
                 # Handle ESC after game over
-                if game.game_over and event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                if game.game_over and event.type == KEYDOWN and event.key == K_ESCAPE:
                     game.state = GameState.MENU
                     set_state(MenuState.START)
                     continue  # Don't process this event further
             
             # Handle menu events
             if current_menu:
-                if isinstance(current_menu, PauseMenu):
-                    current_menu.handle_event(event)
-                else:
-                    current_menu.handle_event(event)
+                current_menu.handle_event(event)
         
-        # Update game
-        if game.state == GameState.PLAYING:
-            game.update_game()
+        # Update game: as many fixed ticks as real time has passed
+        if game.state == PLAYING:
+            now = perf_counter()
+            if last_tick_check is None:
+                elapsed = TICK_SECONDS  # (Re)entering play: one tick, paused time doesn't count
+            else:
+                elapsed = now - last_tick_check
+                if abs(elapsed - TICK_SECONDS) < FRAME_SNAP:
+                    elapsed = TICK_SECONDS
+            last_tick_check = now
+            tick_time = min(tick_time + elapsed, MAX_TICKS_PER_FRAME * TICK_SECONDS)
+            while tick_time >= TICK_SECONDS:
+                game.update_game()
+                tick_time -= TICK_SECONDS
+        else:
+            last_tick_check = None
+            tick_time = 0.0
+        
+        # Ship this frame's multiplayer updates to the network loop in one go
+        if network_sync:
+            network_sync.flush()
         
         # Draw
-        if current_menu:
-            if isinstance(current_menu, PauseMenu):
-                # Draw game first (frozen state), then pause menu overlay
-                # Store the game screen when first paused to avoid redrawing
-                if not hasattr(game, '_paused_screen'):
-                    game.draw_game()
-                    game._paused_screen = game.get_screen().copy()
-                # Draw the stored screen
-                game.get_screen().blit(game._paused_screen, (0, 0))
-                current_menu.draw(game.get_screen())
-            else:
-                current_menu.draw()
-                if hasattr(game, '_paused_screen'):
-                    del game._paused_screen
+        if overlay:
+            # Draw game first (frozen state), then pause menu overlay
+            # Store the game screen when first paused to avoid redrawing
+            if game._paused_screen is None:
+                game.draw_game()
+                frozen_frame.blit(game_screen, (0, 0))
+                game._paused_screen = frozen_frame
+                current_menu.invalidate()
+            if current_menu is not drawn_menu:
+                current_menu.invalidate()
+                drawn_menu = current_menu
+            # The frozen frame never changes, so only the areas the menu repainted are pushed
+            dirty_rects = current_menu.draw(game_screen, game._paused_screen)
+            if dirty_rects:
+                display_update(dirty_rects)
+        elif current_menu:
+            # Menus skip redrawing when unchanged, so repaint on entry
+            if current_menu is not drawn_menu:
+                current_menu.invalidate()
+                drawn_menu = current_menu
+            # Push only what the menu repainted; an idle menu costs no display update
+            dirty_rects = current_menu.draw()
+            if dirty_rects:
+                display_update(dirty_rects)
         else:
+            drawn_menu = None
             game.draw_game()
-            if hasattr(game, '_paused_screen'):
-                del game._paused_screen
+            display_flip()
+        
+        clock_tick(frame_rate)
         
-        # Update display
-        pygame.display.flip()
-        clock.tick(FPS)
+        # Let asyncio tasks (web networking, pygbag's browser loop) run each frame
+        await asyncio.sleep(0)
     
     # Cleanup
     if network_sync:
         network_sync.stop()
     
-    # Quit
+    # Quit (cached fonts are tied to this pygame session)
+    clear_font_cache()
     pygame.quit()
     sys.exit()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
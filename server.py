@@ -6,15 +6,18 @@ Run with: python server.py
 import asyncio
 import json
 import logging
+import secrets
+import string
 from typing import Dict, Set
 from websockets.server import serve
 from websockets.exceptions import ConnectionClosed
+from chainhockey.protocol import is_input_frame, is_state_frame, with_player_num
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Game rooms: room_id -> {players: Set[websocket], game_state: dict}
+# Game rooms: room_id -> {players: Set[websocket], game_state: dict or newest binary state frame}
 rooms: Dict[str, Dict] = {}
 
 # Player connections: websocket -> {room_id, player_num}
@@ -24,19 +27,113 @@ connections: Dict = {}
 MSG_CREATE_ROOM = "create_room"
 MSG_JOIN_ROOM = "join_room"
 MSG_PLAYER_INPUT = "player_input"
+MSG_INPUT_BATCH = "input_batch"
 MSG_GAME_STATE = "game_state"
 MSG_PLAYER_CONNECTED = "player_connected"
 MSG_PLAYER_DISCONNECTED = "player_disconnected"
 MSG_ERROR = "error"
 MSG_ROOM_CREATED = "room_created"
 MSG_ROOM_JOINED = "room_joined"
+MSG_CREDIT = "credit"
+
+# Forwarded game_state messages per credit grant back to the sender. room_created/room_joined
+# carry 'credits': True so clients know to wait for grants (older servers never send any)
+CREDIT_BATCH = 16
+
+# Shortest gap between game states forwarded from one sender (about the 60 Hz game tick);
+# states arriving faster are coalesced into the newest
+STATE_FORWARD_INTERVAL = 1 / 60
+
+# Room codes: 6 uppercase letters/digits
+ROOM_ID_ALPHABET = string.ascii_uppercase + string.digits
+ROOM_ID_LENGTH = 6
 
 
 def generate_room_id() -> str:
-    """Generate a unique room ID"""
-    import random
-    import string
-    return ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
+    """Generate a room ID not used by any open room (unguessable, so rooms can't be probed)"""
+    while True:
+        room_id = ''.join(secrets.choice(ROOM_ID_ALPHABET) for _ in range(ROOM_ID_LENGTH))
+        if room_id not in rooms:
+            return room_id
+
+
+async def broadcast(room, payload, sender=None):
+    """
+    Send one already-serialized payload to every player in the room except sender,
+    with the socket writes overlapped. A failed send to one player doesn't stop the others
+    """
+    await asyncio.gather(*(player_ws.send(payload) for player_ws in room['players'] if player_ws is not sender),
+                         return_exceptions=True)
+
+
+class StateForwarder:
+    """Forwards one sender's game states to the rest of its room at most once per STATE_FORWARD_INTERVAL"""
+    
+    def __init__(self, room, sender):
+        self.room = room
+        self.sender = sender
+        self.last_forward = float('-inf')
+        self.pending = None
+        self.pending_count = 0
+        self.uncredited = 0
+        self.closed = False
+        self._flush_handle = None
+        self._flush_task = None
+    
+    async def submit(self, message):
+        """Forward message now if the interval has passed, else hold it until it has"""
+        # Every state is whole, so the newest replaces any still waiting
+        self.pending = message
+        self.pending_count += 1
+        loop = asyncio.get_running_loop()
+        wait = self.last_forward + STATE_FORWARD_INTERVAL - loop.time()
+        if wait <= 0:
+            await self.flush()
+        elif self._flush_handle is None:
+            # Make sure the newest state still goes out if the sender goes quiet
+            self._flush_handle = loop.call_later(wait, self._flush_later)
+    
+    def _flush_later(self):
+        self._flush_handle = None
+        self._flush_task = asyncio.get_running_loop().create_task(self.flush())
+    
+    async def flush(self):
+        """Forward the pending state, if any, then return credit for every state folded into it"""
+        if self.closed:
+            return
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        message, self.pending = self.pending, None
+        count, self.pending_count = self.pending_count, 0
+        if message is None:
+            return
+        self.last_forward = asyncio.get_running_loop().time()
+        payload = message if isinstance(message, bytes) else json.dumps(message)
+        await broadcast(self.room, payload, self.sender)
+        
+        # Credit only once the states have left the server, so a slow peer throttles the sender
+        self.uncredited += count
+        if self.uncredited >= CREDIT_BATCH:
+            grant, self.uncredited = self.uncredited, 0
+            try:
+                await self.sender.send(json.dumps({
+                    'type': MSG_CREDIT,
+                    'n': grant
+                }))
+            except ConnectionClosed:
+                pass  # The sender's handler cancels this forwarder on its way out
+    
+    def cancel(self):
+        """Stop for good once the sender disconnects: drop the pending state and any scheduled or running flush"""
+        self.closed = True
+        self.pending = None
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
 
 
 async def handle_client(websocket, path):
@@ -46,10 +143,31 @@ async def handle_client(websocket, path):
     
     room_id = None
     player_num = None
+    state_forwarder = None
     
     try:
         async for message in websocket:
             try:
+                if is_input_frame(message):
+                    # Binary player input: relay the frame stamped with the sender's number
+                    if room_id and player_num:
+                        room = rooms.get(room_id)
+                        if room:
+                            frame = with_player_num(message, player_num)
+                            await broadcast(room, frame, websocket)
+                    continue
+                
+                if is_state_frame(message):
+                    # Binary game state: keep the newest frame and forward the bytes unparsed
+                    if room_id:
+                        room = rooms.get(room_id)
+                        if room:
+                            room['game_state'] = message
+                            if state_forwarder is None or state_forwarder.room is not room:
+                                state_forwarder = StateForwarder(room, websocket)
+                            await state_forwarder.submit(message)
+                    continue
+                
                 data = json.loads(message)
                 msg_type = data.get('type')
                 
@@ -71,7 +189,8 @@ async def handle_client(websocket, path):
                     await websocket.send(json.dumps({
                         'type': MSG_ROOM_CREATED,
                         'room_id': room_id,
-                        'player_num': 1
+                        'player_num': 1,
+                        'credits': True
                     }))
                     logger.info(f"Room created: {room_id} by {client_id}")
                 
@@ -109,16 +228,15 @@ async def handle_client(websocket, path):
                     await websocket.send(json.dumps({
                         'type': MSG_ROOM_JOINED,
                         'room_id': room_id,
-                        'player_num': 2
+                        'player_num': 2,
+                        'credits': True
                     }))
                     
                     # Notify other player
-                    for player_ws in room['players']:
-                        if player_ws != websocket:
-                            await player_ws.send(json.dumps({
-                                'type': MSG_PLAYER_CONNECTED,
-                                'player_num': 2
-                            }))
+                    await broadcast(room, json.dumps({
+                        'type': MSG_PLAYER_CONNECTED,
+                        'player_num': 2
+                    }), websocket)
                     
                     logger.info(f"Player joined room {room_id}: {client_id} as Player 2")
                 
@@ -128,27 +246,38 @@ async def handle_client(websocket, path):
                         room = rooms.get(room_id)
                         if room:
                             # Broadcast to other player(s)
-                            for player_ws in room['players']:
-                                if player_ws != websocket:
-                                    await player_ws.send(json.dumps({
-                                        'type': MSG_PLAYER_INPUT,
-                                        'player_num': player_num,
-                                        'input': data.get('input')
-                                    }))
+                            await broadcast(room, json.dumps({
+                                'type': MSG_PLAYER_INPUT,
+                                'player_num': player_num,
+                                'input': data.get('input')
+                            }), websocket)
+                
+                elif msg_type == MSG_INPUT_BATCH:
+                    # Inputs are absolute snapshots, so only the newest needs forwarding
+                    inputs = data.get('inputs')
+                    if room_id and player_num and inputs:
+                        room = rooms.get(room_id)
+                        if room:
+                            await broadcast(room, json.dumps({
+                                'type': MSG_PLAYER_INPUT,
+                                'player_num': player_num,
+                                'input': inputs[-1]
+                            }), websocket)
                 
                 elif msg_type == MSG_GAME_STATE:
-                    # Update and broadcast game state
+                    # JSON fallback for states that don't fit the binary frame
                     if room_id:
                         room = rooms.get(room_id)
                         if room:
                             room['game_state'] = data.get('state')
-                            # Broadcast to other player
-                            for player_ws in room['players']:
-                                if player_ws != websocket:
-                                    await player_ws.send(json.dumps({
-                                        'type': MSG_GAME_STATE,
-                                        'state': data.get('state')
-                                    }))
+                            forward = {
+                                'type': MSG_GAME_STATE,
+                                'state': data.get('state')
+                            }
+                            # Broadcast to other player, rate-limited
+                            if state_forwarder is None or state_forwarder.room is not room:
+                                state_forwarder = StateForwarder(room, websocket)
+                            await state_forwarder.submit(forward)
             
             except json.JSONDecodeError:
                 await websocket.send(json.dumps({
@@ -165,6 +294,9 @@ async def handle_client(websocket, path):
     except ConnectionClosed:
         logger.info(f"Client disconnected: {client_id}")
     finally:
+        if state_forwarder is not None:
+            state_forwarder.cancel()
+        
         # Clean up on disconnect
         if websocket in connections:
             conn_info = connections[websocket]
@@ -175,14 +307,10 @@ async def handle_client(websocket, path):
                 room['players'].discard(websocket)
                 
                 # Notify other player
-                for player_ws in room['players']:
-                    try:
-                        await player_ws.send(json.dumps({
-                            'type': MSG_PLAYER_DISCONNECTED,
-                            'player_num': conn_info.get('player_num')
-                        }))
-                    except:
-                        pass
+                await broadcast(room, json.dumps({
+                    'type': MSG_PLAYER_DISCONNECTED,
+                    'player_num': conn_info.get('player_num')
+                }))
                 
                 # Remove room if empty
                 if len(room['players']) == 0:
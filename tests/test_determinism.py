@@ -0,0 +1,66 @@
+"""
+The numba kernels must give bit-identical results to the plain-Python paths used
+where numba is unavailable (web builds), or a host and a peer drift apart.
+Run with: python -m unittest discover tests
+"""
+
+import random
+import unittest
+
+from chainhockey import chain_kernel, physics
+
+
+@unittest.skipUnless(chain_kernel.NUMBA_AVAILABLE, "numba not installed")
+class KernelDeterminismTest(unittest.TestCase):
+
+    def _chain(self, rng, n):
+        xs = [600.0 + 15 * i + rng.uniform(-3, 3) for i in range(n)]
+        ys = [350.0 + rng.uniform(-3, 3) for _ in range(n)]
+        return xs, ys
+
+    def test_step_chain_matches_python_fallbacks(self):
+        rng = random.Random(7)
+        n = 11
+        xs, ys = self._chain(rng, n)
+        compiled = [chain_kernel.coordinate_array(v) for v in (xs, ys, xs, ys)]
+        interpreted = [list(v) for v in (xs, ys, xs, ys)]
+        unrolled_step = chain_kernel._unrolled_steps.get(n)
+        if unrolled_step is None:
+            namespace = {'sqrt': chain_kernel.sqrt, 'REST_TOLERANCE': chain_kernel.REST_TOLERANCE}
+            exec(chain_kernel._unrolled_source(n), namespace)
+            unrolled_step = namespace['step']
+        unrolled = [list(v) for v in (xs, ys, xs, ys)]
+
+        for frame in range(500):
+            sx = 800 + 300 * rng.random()
+            sy = 100 + 500 * rng.random()
+            args = (sx, sy, 32.0, 0.8 ** (1 / 3), 0.0, 15.0, 3, 620.0, 1180.0, 700.0)
+            chain_kernel.step_chain(*compiled, *args)
+            chain_kernel.step_chain.py_func(*interpreted, *args)
+            unrolled_step(*unrolled, *args)
+            self.assertEqual(compiled[0].tolist(), interpreted[0], frame)
+            self.assertEqual(compiled[1].tolist(), interpreted[1], frame)
+            self.assertEqual(unrolled[0], interpreted[0], frame)
+            self.assertEqual(unrolled[1], interpreted[1], frame)
+
+    def test_collide_with_bodies_matches_python(self):
+        rng = random.Random(11)
+        for trial in range(300):
+            bodies = physics.Bodies(5)
+            for row in bodies.rows[:4]:
+                for i in range(5):
+                    row[i] = rng.uniform(0, 60)
+            for i, (radius, mass, restitution, recoil) in enumerate(
+                    [(15, 1, 1, 1), (20, 10, 1.2, 0), (20, 10, 1.2, 0), (30, 5, 0.4, 1), (30, 5, 0.4, 1)]):
+                bodies.rows[physics.BODY_RADIUS][i] = radius
+                bodies.rows[physics.BODY_INV_MASS][i] = 1.0 / mass
+                bodies.rows[physics.BODY_RESTITUTION][i] = restitution
+                bodies.rows[physics.BODY_RECOIL][i] = recoil
+            expected = bodies.table.tolist()
+            physics.collide_with_bodies.py_func(expected, 0)
+            physics.collide_with_bodies(bodies.table, 0)
+            self.assertEqual(bodies.table.tolist(), expected, trial)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Timing of server.StateForwarder: at most one forward per STATE_FORWARD_INTERVAL,
+the newest state going out once the interval ends, and nothing after cancel().
+Run with: python -m unittest discover tests
+"""
+
+import asyncio
+import json
+import unittest
+
+import server
+
+
+class FakeSocket:
+    """Records what the server sends it, with the loop time of each send"""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, payload):
+        self.sent.append((asyncio.get_running_loop().time(), payload))
+
+
+class StateForwarderTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.sender = FakeSocket()
+        self.peer = FakeSocket()
+        self.room = {'players': {self.sender, self.peer}}
+        self.forwarder = server.StateForwarder(self.room, self.sender)
+
+    async def test_burst_is_coalesced_then_flushed(self):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await self.forwarder.submit(b'first')
+        await self.forwarder.submit(b'second')
+        await self.forwarder.submit(b'third')
+        self.assertEqual([payload for _, payload in self.peer.sent], [b'first'])
+
+        await asyncio.sleep(server.STATE_FORWARD_INTERVAL * 3)
+        self.assertEqual([payload for _, payload in self.peer.sent], [b'first', b'third'])
+        flushed_at = self.peer.sent[1][0]
+        self.assertGreaterEqual(flushed_at - start, server.STATE_FORWARD_INTERVAL)
+
+    async def test_credit_counts_coalesced_states(self):
+        for i in range(server.CREDIT_BATCH):
+            await self.forwarder.submit(bytes([i]))
+        self.assertEqual(self.sender.sent, [])
+
+        await asyncio.sleep(server.STATE_FORWARD_INTERVAL * 3)
+        self.assertEqual(len(self.peer.sent), 2)
+        credit = json.loads(self.sender.sent[-1][1])
+        self.assertEqual(credit, {'type': server.MSG_CREDIT, 'n': server.CREDIT_BATCH})
+
+    async def test_nothing_forwarded_after_cancel(self):
+        await self.forwarder.submit(b'first')
+        await self.forwarder.submit(b'second')
+        self.forwarder.cancel()
+        await asyncio.sleep(server.STATE_FORWARD_INTERVAL * 3)
+        await self.forwarder.flush()
+        self.assertEqual([payload for _, payload in self.peer.sent], [b'first'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,9 +10,9 @@ from main import main
 
 async def main_async():
     """Async wrapper for main function (required by pygbag)"""
-    # Pygbag requires async main
+    # Pygbag requires async main; main() yields to the browser loop every frame
     await asyncio.sleep(0)  # Yield to event loop
-    main()
+    await main()
 
 if __name__ == "__main__":
     # For web build, use async
@@ -20,7 +20,6 @@ if __name__ == "__main__":
         asyncio.run(main_async())
     except RuntimeError:
         # If already in event loop (web environment)
-        import asyncio
         loop = asyncio.get_event_loop()
         loop.run_until_complete(main_async())
 